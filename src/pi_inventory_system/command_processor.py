@@ -16,10 +16,10 @@ except ImportError:
     W2N_AVAILABLE = False
     logging.warning("word2number not available, number word parsing limited")
 
-try:
-    import spacy  # type: ignore
-except Exception:
-    spacy = None  # type: ignore
+# spaCy is imported on first use by _ensure_nlp: the import alone costs about
+# half a second (several on a Pi) and the rule-based parser never needs it.
+spacy = None  # type: ignore
+_spacy_import_attempted = False
 
 _nlp = None
 _nlp_load_attempted = False
@@ -47,6 +47,26 @@ _CLEAR_RE = re.compile(
 )
 
 
+def _verb_alternation(verbs) -> str:
+    # Longest first so multi-word verbs win over their prefixes.
+    return "|".join(re.escape(verb) for verb in sorted(verbs, key=len, reverse=True))
+
+
+# The verb vocabulary is fixed, so every verb regex is compiled once here
+# rather than re-joined and re-looked-up in the re cache on each command.
+_VERB_RES = tuple(
+    (re.compile(rf"\b(?:{_verb_alternation(verbs)})\b"), label)
+    for verbs, label in VERB_LABELS
+)
+_STRIP_VERB_RES = {
+    verbs: re.compile(rf"^.*?\b(?:{_verb_alternation(verbs)})\b\s*")
+    for verbs, _ in VERB_LABELS
+}
+_ALL_COMMAND_WORDS = tuple(
+    verb for verbs, _ in VERB_LABELS for verb in verbs) + UNDO_WORDS
+_EARLIER_VERB_RE = re.compile(rf"\b(?:{_verb_alternation(_ALL_COMMAND_WORDS)})\b")
+
+
 def _alias_clear_command(command_text: str) -> str:
     """Rewrite 'clear X' to 'remove all X'.
 
@@ -56,10 +76,7 @@ def _alias_clear_command(command_text: str) -> str:
     if not match:
         return command_text
     prefix = command_text[:match.start()]
-    earlier_verbs = tuple(
-        verb for verbs, _ in VERB_LABELS for verb in verbs) + UNDO_WORDS
-    earlier_pattern = "|".join(re.escape(verb) for verb in earlier_verbs)
-    if re.search(rf"\b(?:{earlier_pattern})\b", prefix):
+    if _EARLIER_VERB_RE.search(prefix):
         return command_text
     return "remove all " + command_text[match.end():].lstrip()
 
@@ -75,6 +92,19 @@ _QTY_INVALID = "invalid"
 _NUMERIC_TOKEN_RE = re.compile(r"^[+-]?\d+(?:\.\d+)?$")
 
 
+def _import_spacy():
+    """Import spaCy once; None when it is not installed. Call under _nlp_lock."""
+    global spacy, _spacy_import_attempted
+    if spacy is None and not _spacy_import_attempted:
+        _spacy_import_attempted = True
+        try:
+            import spacy as spacy_module  # type: ignore
+            spacy = spacy_module
+        except Exception as e:
+            logging.info(f"spaCy not available, using rule-based parsing: {e}")
+    return spacy
+
+
 def _ensure_nlp(config_manager):
     """Load spaCy lazily. Permanent skips (no spacy installed, disabled in
     config) latch via _nlp_load_attempted. OSError can be transient (partially
@@ -90,14 +120,14 @@ def _ensure_nlp(config_manager):
         if _nlp_load_attempted:
             return _nlp
 
-        if spacy is None:
-            _nlp_load_attempted = True
-            return None
         nlp_config = config_manager.get_nlp_config()
         if not nlp_config.get('enable_spacy', True):
             logging.info("spaCy disabled in configuration, using rule-based parsing")
             _nlp_load_attempted = True
             return None
+        if _import_spacy() is None:
+            _nlp_load_attempted = True
+            return None
         model_name = nlp_config.get('spacy_model', 'en_core_web_sm')
         try:
             _nlp = spacy.load(model_name)
@@ -193,11 +223,8 @@ def _classify_verb(command_text: str, config_manager) -> Optional[str]:
             logging.error(f"spaCy classification failed: {e}")
 
     matches = []
-    for verb_set, label in VERB_LABELS:
-        verb_pattern = "|".join(
-            re.escape(verb) for verb in sorted(verb_set, key=len, reverse=True)
-        )
-        match = re.search(rf"\b(?:{verb_pattern})\b", command_text)
+    for verb_re, label in _VERB_RES:
+        match = verb_re.search(command_text)
         if match:
             matches.append((match.start(), label))
     if matches:
@@ -207,15 +234,10 @@ def _classify_verb(command_text: str, config_manager) -> Optional[str]:
 
 def _strip_command_verb(command_text: str, verbs) -> str:
     """Remove the matched command verb while preserving the item phrase."""
-    verb_pattern = "|".join(
-        re.escape(verb) for verb in sorted(verbs, key=len, reverse=True)
-    )
-    return re.sub(
-        rf"^.*?\b(?:{verb_pattern})\b\s*",
-        "",
-        command_text,
-        count=1,
-    ).strip()
+    strip_re = _STRIP_VERB_RES.get(verbs)
+    if strip_re is None:
+        strip_re = re.compile(rf"^.*?\b(?:{_verb_alternation(verbs)})\b\s*")
+    return strip_re.sub("", command_text, count=1).strip()
 
 
 def _clean_item_words(words):
@@ -81,7 +81,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     'hardware': {
         'motion_sensor': {
             'enabled': True,
-            'pin': 4
+            'pin': 4,
+            'use_interrupt': True
         },
         'display': {
             'enabled': True,
@@ -177,7 +178,8 @@ class ConfigManager:
         """Convert environment variable string to appropriate type."""
         if key in ['size', 'fallback_size', 'items_per_row', 'lozenge_height', 'spacing',
                    'margin', 'low_stock_threshold', 'phrase_time_limit', 'rate',
-                   'device_index', 'pin', 'grayscale_levels', 'cache_size']:
+                   'device_index', 'sample_rate', 'pin', 'grayscale_levels',
+                   'cache_size']:
             try:
                 return int(value)
             except ValueError:
@@ -196,7 +198,7 @@ class ConfigManager:
                 logger.warning(f"Invalid float value for {key}: {value}; override ignored")
                 return None
         elif key in ['enabled', 'auto_detect', 'enable_diagnostics', 'enable_spacy',
-                     'clear_on_shutdown', 'show_startup_message']:
+                     'clear_on_shutdown', 'show_startup_message', 'use_interrupt']:
             return value.lower() in ('true', '1', 'yes', 'on')
         return value
 
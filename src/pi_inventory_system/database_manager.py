@@ -19,6 +19,12 @@ VALID_JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
 VALID_SYNCHRONOUS_MODES = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
 VALID_TEMP_STORES = {'DEFAULT', 'FILE', 'MEMORY'}
 
+# Packaged migration scripts, keyed by package: (name, sql_text) pairs.
+_MIGRATION_CACHE: dict = {}
+
+# Read before every mutation; see get_current_quantity.
+_SELECT_QUANTITY_SQL = "SELECT quantity FROM inventory WHERE item_name = ?"
+
 
 def _safe_pragma_choice(value: Any, allowed: set[str], default: str) -> str:
     choice = str(value).upper()
@@ -116,11 +122,15 @@ class DatabaseManager:
     
     @contextmanager
     def _transaction(self):
-        """Simple transaction context manager."""
+        """Simple transaction context manager.
+
+        Every caller reads then writes, so take the write lock up front with
+        BEGIN IMMEDIATE rather than upgrading a deferred read mid-transaction.
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
         try:
-            cursor.execute("BEGIN")
+            cursor.execute("BEGIN IMMEDIATE")
             yield conn
             conn.commit()
         except Exception:
@@ -145,14 +155,21 @@ class DatabaseManager:
                 raise
 
     def _list_migrations(self):
-        """Return a sorted list of (name, sql_text) pairs from the package."""
-        pkg = resources.files(__package__).joinpath('migrations')
-        items = []
-        for entry in pkg.iterdir():
-            if entry.name.endswith('.sql'):
-                items.append((entry.name, entry.read_text()))
-        items.sort(key=lambda pair: pair[0])
-        return items
+        """Return a sorted list of (name, sql_text) pairs from the package.
+
+        The scripts ship with the package and cannot change at runtime, so
+        they are read once per process and shared by every manager.
+        """
+        cached = _MIGRATION_CACHE.get(__package__)
+        if cached is None:
+            pkg = resources.files(__package__).joinpath('migrations')
+            cached = tuple(sorted(
+                (entry.name, entry.read_text())
+                for entry in pkg.iterdir()
+                if entry.name.endswith('.sql')
+            ))
+            _MIGRATION_CACHE[__package__] = cached
+        return list(cached)
 
     @staticmethod
     def _split_sql_statements(script: str):
@@ -221,16 +238,11 @@ class DatabaseManager:
         storage failure."""
         with self._lock:
             try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                try:
-                    cursor.execute(
-                        "SELECT quantity FROM inventory WHERE item_name = ?",
-                        (item_name,)
-                    )
-                    result = cursor.fetchone()
-                finally:
-                    cursor.close()
+                # Identical SQL text lets sqlite3's per-connection statement
+                # cache hand back the prepared statement on every call.
+                result = self._get_connection().execute(
+                    _SELECT_QUANTITY_SQL, (item_name,)
+                ).fetchone()
                 return result['quantity'] if result else 0
             except sqlite3.Error as e:
                 logger.error(f"Database error in get_current_quantity({item_name}): {e}")
@@ -250,15 +262,13 @@ class DatabaseManager:
             )
             return
 
+        # One UPSERT instead of UPDATE-then-INSERT; the DO UPDATE branch still
+        # fires the quantity UPDATE triggers (range check, last_modified).
         cursor.execute(
-            "UPDATE inventory SET quantity = ? WHERE item_name = ?",
-            (quantity, item_name)
+            "INSERT INTO inventory (item_name, quantity) VALUES (?, ?) "
+            "ON CONFLICT(item_name) DO UPDATE SET quantity = excluded.quantity",
+            (item_name, quantity)
         )
-        if cursor.rowcount == 0:
-            cursor.execute(
-                "INSERT INTO inventory (item_name, quantity) VALUES (?, ?)",
-                (item_name, quantity)
-            )
 
     def _next_action_id(self, cursor: sqlite3.Cursor) -> int:
         """Allocate the next action_id. action_ids are monotonic per process
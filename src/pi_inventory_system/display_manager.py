@@ -193,9 +193,31 @@ def create_lozenge(draw, x, y, width, height, item_name, quantity, font, colors)
     
     draw.text((text_x, text_y), text, fill=text_color, font=font)
 
-def _render(display, draw_fn, label: str) -> bool:
-    """Shared boilerplate: validate display, build a white L-mode image, run
-    draw_fn(draw, image), push to the panel."""
+_INVENTORY_HEADER = "Fridge Inventory"
+_TEMPLATE_CACHE: dict = {}
+
+
+def _inventory_template(width, height, header_font):
+    """Return the static inventory frame (white page + header), rendered once
+    per (size, font). Callers must copy() it before drawing."""
+    cache_key = (width, height, header_font)
+    template = _TEMPLATE_CACHE.get(cache_key)
+    if template is not None:
+        return template
+
+    template = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(template)
+    header_bbox = draw.textbbox((0, 0), _INVENTORY_HEADER, font=header_font)
+    header_x = (width - (header_bbox[2] - header_bbox[0])) // 2
+    draw.text((header_x, 10), _INVENTORY_HEADER, fill=0, font=header_font)
+    _TEMPLATE_CACHE[cache_key] = template
+    return template
+
+
+def _render(display, draw_fn, label: str, template_fn=None) -> bool:
+    """Shared boilerplate: validate display, build a white L-mode image (or
+    copy the cached frame from template_fn), run draw_fn(draw, image), push
+    to the panel."""
     if not display:
         logger.warning(f"No display available for {label}")
         return False
@@ -203,7 +225,10 @@ def _render(display, draw_fn, label: str) -> bool:
         logger.error("Display object missing WIDTH or HEIGHT attributes")
         return False
     try:
-        image = Image.new("L", (display.WIDTH, display.HEIGHT), 255)
+        if template_fn is not None:
+            image = template_fn().copy()
+        else:
+            image = Image.new("L", (display.WIDTH, display.HEIGHT), 255)
         draw = ImageDraw.Draw(image)
         draw_fn(draw, image)
         display.display_image(image)
@@ -237,7 +262,6 @@ def display_inventory(display, inventory, config_manager):
 
         # layout.font_size overrides; otherwise display.font.size from config.
         font = _load_font(config_manager, size=layout_config.get('font_size'))
-        header_font = _load_font(config_manager, size=24)
         timestamp_font = _load_font(config_manager, size=20)
         color_config = config_manager.get('display', 'colors', default={})
 
@@ -253,11 +277,7 @@ def display_inventory(display, inventory, config_manager):
         rows_per_page = (available_height + spacing) // (lozenge_height + spacing)
         max_items = rows_per_page * items_per_row
 
-        header_text = "Fridge Inventory"
-        header_bbox = draw.textbbox((0, 0), header_text, font=header_font)
-        header_x = (display.WIDTH - (header_bbox[2] - header_bbox[0])) // 2
-        draw.text((header_x, 10), header_text, fill=0, font=header_font)
-
+        # The header is already on the page: it comes from the cached template.
         items_displayed = 0
         inventory_to_render = list(inventory)
         if len(inventory_to_render) > max_items and max_items > 0:
@@ -295,7 +315,12 @@ def display_inventory(display, inventory, config_manager):
                   timestamp, fill=0, font=timestamp_font)
         logger.info(f"Displayed {items_displayed} inventory items")
 
-    return _render(display, _draw, "inventory display")
+    def _template():
+        header_font = _load_font(config_manager, size=24)
+        return _inventory_template(display.WIDTH, display.HEIGHT, header_font)
+
+    return _render(display, _draw, "inventory display",
+                   template_fn=_template if inventory else None)
 
 _FONT_CACHE: dict = {}
 
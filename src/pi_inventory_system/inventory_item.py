@@ -1,22 +1,36 @@
 # Module for inventory item representation
 
-from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple
 
-@dataclass
-class InventoryItem:
-    """Class representing an inventory item with its quantity."""
+
+class _InventoryItemFields(NamedTuple):
     item_name: str
     quantity: int
 
-    def __post_init__(self):
-        """Validate the item after initialization."""
-        if not isinstance(self.item_name, str):
+
+class InventoryItem(_InventoryItemFields):
+    """Immutable inventory item with its quantity.
+
+    A NamedTuple so equality and hashing are C-level tuple operations; use
+    ``item._replace(quantity=...)`` to derive a changed copy.
+    """
+    __slots__ = ()
+
+    def __new__(cls, item_name: str, quantity: int) -> 'InventoryItem':
+        """Validate the fields before building the tuple."""
+        if not isinstance(item_name, str):
             raise ValueError("item_name must be a string")
-        if not isinstance(self.quantity, int):
+        if not isinstance(quantity, int):
             raise ValueError("quantity must be an integer")
-        if self.quantity < 0:
+        if quantity < 0:
             raise ValueError("quantity cannot be negative")
+        return super().__new__(cls, item_name, quantity)
+
+    @classmethod
+    def _make(cls, iterable) -> 'InventoryItem':
+        # The generated _make (used by _replace) bypasses __new__; route it
+        # through validation so derived copies keep the same invariants.
+        return cls(*iterable)
 
     @classmethod
     def from_tuple(cls, item_tuple: tuple) -> 'InventoryItem':
@@ -27,4 +41,4 @@ class InventoryItem:
 
     def to_tuple(self) -> tuple[str, int]:
         """Convert the item to a tuple of (item_name, quantity)."""
-        return (self.item_name, self.quantity) 
\ No newline at end of file
+        return (self.item_name, self.quantity)
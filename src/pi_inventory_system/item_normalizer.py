@@ -1,7 +1,9 @@
 # Module for normalizing item names with synonyms and fuzzy matching
 
 from difflib import SequenceMatcher
+from functools import lru_cache
 import re
+from types import MappingProxyType
 
 
 # Define item synonyms and base names
@@ -56,6 +58,49 @@ ITEM_SYNONYMS = {
     ]
 }
 
+# Exact-match index (base name or synonym -> base name), built once at import
+# so lookups are a single hash probe instead of a scan over every synonym
+# list. setdefault keeps the first base name in ITEM_SYNONYMS order on clashes.
+def _build_synonym_index(synonym_table):
+    index = {}
+    for base_name, synonyms in synonym_table.items():
+        index.setdefault(base_name, base_name)
+        for synonym in synonyms:
+            index.setdefault(synonym, base_name)
+    return MappingProxyType(index)
+
+
+_SYNONYM_INDEX = _build_synonym_index(ITEM_SYNONYMS)
+
+# (candidate, base name) pairs in ITEM_SYNONYMS order for fuzzy matching; the
+# order matters because only a strictly better ratio replaces the best match.
+_MATCH_CANDIDATES = tuple(
+    (candidate, base_name)
+    for base_name, synonyms in ITEM_SYNONYMS.items()
+    for candidate in (base_name, *synonyms)
+)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def _fuzzy_match(item_name, threshold):
+    """Best base name scoring above threshold, or None.
+
+    Scoring every candidate with SequenceMatcher is the expensive part of
+    normalization, and speech recognition keeps producing the same handful
+    of near-misses, so results are memoized per (name, threshold).
+    """
+    best_match = None
+    best_ratio = threshold
+    for candidate, base_name in _MATCH_CANDIDATES:
+        ratio = SequenceMatcher(None, item_name, candidate).ratio()
+        if ratio > best_ratio:
+            best_match = base_name
+            best_ratio = ratio
+    return best_match
+
+
 def normalize_item_name(item_name, config_manager):
     """
     Normalize an item name by:
@@ -65,32 +110,17 @@ def normalize_item_name(item_name, config_manager):
     4. Using fuzzy matching for similar items
     """
     # Clean the input
-    item_name = item_name.lower().strip()
-    item_name = re.sub(r'\s+', ' ', item_name)
+    item_name = _WHITESPACE_RE.sub(' ', item_name.lower().strip())
     
     # First try exact matches in synonyms
-    for base_name, synonyms in ITEM_SYNONYMS.items():
-        if item_name == base_name or item_name in synonyms:
-            return base_name
+    exact = _SYNONYM_INDEX.get(item_name)
+    if exact is not None:
+        return exact
     
     # Then try fuzzy matching
-    best_match = None
     command_config = config_manager.get_command_config() if config_manager is not None else {}
-    best_ratio = command_config.get('similarity_threshold', 0.8)
-    
-    for base_name, synonyms in ITEM_SYNONYMS.items():
-        # Check against base name
-        ratio = SequenceMatcher(None, item_name, base_name).ratio()
-        if ratio > best_ratio:
-            best_match = base_name
-            best_ratio = ratio
-        
-        # Check against synonyms
-        for synonym in synonyms:
-            ratio = SequenceMatcher(None, item_name, synonym).ratio()
-            if ratio > best_ratio:
-                best_match = base_name
-                best_ratio = ratio
+    threshold = command_config.get('similarity_threshold', 0.8)
+    best_match = _fuzzy_match(item_name, threshold)
     
     return best_match if best_match else item_name
 
@@ -116,6 +116,8 @@ class FridgePinventoryApp:
         self.shutdown_event = threading.Event()
 
         self._voice_future: Optional[_VoiceTask] = None
+        self._voice_warmup: Optional[_VoiceTask] = None
+        self._voice_kick_pending = False
         self._voice_started_at: Optional[float] = None
         self._last_voice_kick_at: Optional[float] = None
         self._voice_timeout_logged = False
@@ -168,9 +170,28 @@ class FridgePinventoryApp:
         # or two during the WAV smoke-test; re-enable both breakers so runtime
         # feedback is heard.
         self.audio_feedback.reset_circuit_breakers()
+        self._start_voice_warmup()
         self.logger.info("FridgePinventory initialization complete")
         return True
 
+    def _start_voice_warmup(self) -> None:
+        """Open the microphone and run ambient calibration in the background
+        so the first command does not pay for it.
+
+        Runs as the current voice task, so the usual timeout retires it if
+        the audio stack hangs. A kick that arrives meanwhile is held and
+        re-issued once the warm-up finishes. Skipped in manual mode, where
+        nothing opens the microphone.
+        """
+        if self._voice_future is not None or self._voice_disabled:
+            return
+        if self._activation_mode() == ACTIVATION_MANUAL:
+            return
+        self._voice_started_at = time.monotonic()
+        self._voice_future = _VoiceTask(self.voice_manager.initialize)
+        self._voice_warmup = self._voice_future
+        self._voice_future.start()
+
     def _refresh_display_best_effort(self) -> None:
         if not self.controller:
             return
@@ -206,6 +227,30 @@ class FridgePinventoryApp:
             return 5.0
         return float(interval)
 
+    def _sleep_until_next_check(self, loop: MotionLoop, timeout: float) -> None:
+        """Sleep between loop ticks, blocking on the motion edge only in idle.
+
+        Active and tracking modes expect motion or its end within the
+        interval, and gpiozero's level-based wait would return at once while
+        the PIR stays high, so they use the interruptible shutdown wait.
+        """
+        if loop.mode == IDLE:
+            self._wait_for_motion_edge(loop, timeout)
+        else:
+            self.shutdown_event.wait(timeout=timeout)
+
+    def _wait_for_motion_edge(self, loop: MotionLoop, timeout: float) -> None:
+        """Sleep until the next check, waking early on a motion edge.
+
+        Falls back to the interruptible shutdown wait unless the sensor
+        actually blocked on an edge (wait_for_motion returned a bool).
+        """
+        woke = self.motion_manager.wait_for_motion(timeout)
+        if woke is True:
+            loop.request_check()
+        elif woke is not False:
+            self.shutdown_event.wait(timeout=timeout)
+
     def _build_motion_loop(self) -> MotionLoop:
         system_config = self.config_manager.get_system_config()
         return MotionLoop(
@@ -289,7 +334,8 @@ class FridgePinventoryApp:
                 self._voice_future = None
                 self._voice_started_at = None
                 self._voice_timeout_logged = False
-            return False
+                self._voice_warmup = None
+            return self._start_deferred_kick("Voice warm-up finished")
 
         if self._voice_started_at is not None:
             elapsed = time.monotonic() - self._voice_started_at
@@ -297,9 +343,19 @@ class FridgePinventoryApp:
                 self.logger.warning("Voice command timed out")
                 self._voice_timeout_logged = True
                 self._reset_voice_worker()
-                return False
+                return self._start_deferred_kick("Voice warm-up retired")
         return True
 
+    def _start_deferred_kick(self, reason: str) -> bool:
+        """Re-issue a kick held back during warm-up; return True when a voice
+        task is now running."""
+        if not self._voice_kick_pending:
+            return False
+        self._voice_kick_pending = False
+        self.logger.info(f"{reason}; starting deferred voice command")
+        self._kick_voice_command()
+        return self._voice_future is not None
+
     def _reset_voice_worker(self) -> None:
         """Retire a stuck voice worker so subsequent commands can run.
 
@@ -322,11 +378,17 @@ class FridgePinventoryApp:
         self._voice_future = None
         self._voice_started_at = None
         self._voice_timeout_logged = False
+        # A kick deferred during warm-up stays pending so the caller can
+        # retry it on the fresh manager.
+        self._voice_warmup = None
         self._prune_orphaned_voice_tasks()
         if len(self._orphaned_voice_tasks) >= MAX_ORPHANED_VOICE_TASKS:
             self._voice_disabled = True
             self._owned_voice_manager = None
             self.logger.error("Voice input disabled after repeated recognition timeouts")
+            if self._voice_kick_pending:
+                self._voice_kick_pending = False
+                self.logger.warning("Dropping deferred voice command; voice input disabled")
             return
 
         self.voice_manager = VoiceRecognitionManager(config_manager=self.config_manager)
@@ -410,6 +472,9 @@ class FridgePinventoryApp:
             self.logger.warning("Voice input disabled; skipping voice command")
             return
         if self._check_voice_future():
+            if self._voice_future is self._voice_warmup:
+                self.logger.info("Voice warm-up in progress; deferring voice command")
+                self._voice_kick_pending = True
             return
         # Half-duplex: never record while we are playing chimes/TTS (plus an
         # echo-decay grace) or the mic re-recognizes our own feedback.
@@ -557,10 +622,7 @@ class FridgePinventoryApp:
                 )
                 self._maybe_continue_listening(loop)
 
-                if loop.mode == IDLE:
-                    self.shutdown_event.wait(timeout=decision.sleep_seconds)
-                else:
-                    time.sleep(decision.sleep_seconds)
+                self._sleep_until_next_check(loop, decision.sleep_seconds)
         except Exception as e:
             self.logger.error(f"Unexpected error in main loop: {e}")
             self.logger.error(f"Traceback: {traceback.format_exc()}")
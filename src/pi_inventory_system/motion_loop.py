@@ -46,6 +46,11 @@ class MotionLoop:
         self.last_motion_time: Optional[float] = None
         self.last_check_time: float = -math.inf
 
+    def request_check(self) -> None:
+        """Make the next step() read the sensor regardless of the check
+        interval, e.g. after an edge interrupt woke an idle wait early."""
+        self.last_check_time = -math.inf
+
     def _check_interval(self) -> float:
         return self.idle_delay if self.mode == IDLE else self.motion_check_interval
 
@@ -28,6 +28,7 @@ class MotionSensorManager:
         self._gpio = None
         self._gpiozero_sensor = None
         self._last_error: Optional[str] = None
+        self._edge_wait_disabled = False
         self._pin = pin if pin is not None else self._get_configured_pin()
         self._is_pi5 = platform_info.is_raspberry_pi_5()
         self._is_pi = platform_info.is_raspberry_pi()
@@ -212,6 +213,16 @@ class MotionSensorManager:
             self._set_error(f"Unexpected error reading pin with pinctrl: {e}")
             return False
 
+    def _read_pin_gpio(self) -> bool:
+        """Read GPIO pin state through RPi.GPIO on pre-Pi 5 boards."""
+        try:
+            motion_detected = bool(self._gpio.input(self._pin))
+        except (RuntimeError, OSError) as e:
+            self._set_error(f"Failed to read GPIO pin {self._pin}: {e}")
+            return False
+        self._clear_error()
+        return motion_detected
+
     def _ensure_initialized(self) -> bool:
         if self._initialized:
             return True
@@ -241,17 +252,18 @@ class MotionSensorManager:
             return False
         
         try:
+            # Reads share the init/cleanup lock so concurrent callers take
+            # turns on the pin and never race cleanup() closing it.
             with self._lock:
                 if not self._ensure_initialized():
                     return False
 
-            if self._is_pi5:
-                motion_detected = self._read_pin_pi5()
-            elif self._gpio:
-                motion_detected = bool(self._gpio.input(self._pin))
-                self._clear_error()
-            else:
-                return False
+                if self._is_pi5:
+                    motion_detected = self._read_pin_pi5()
+                elif self._gpio:
+                    motion_detected = self._read_pin_gpio()
+                else:
+                    return False
 
             if motion_detected:
                 self.logger.info(f"Motion detected on pin {self._pin}")
@@ -261,6 +273,45 @@ class MotionSensorManager:
             self._set_error(f"Error detecting motion: {e}")
             return False
     
+    def wait_for_motion(self, timeout: float) -> Optional[bool]:
+        """Block until the sensor reports motion or ``timeout`` elapses.
+
+        Uses the kernel interrupt instead of polling. On Pi 5, gpiozero's
+        ``wait_for_motion`` is level-based: it returns at once while the pin
+        is already high. Elsewhere ``GPIO.wait_for_edge`` waits for a rising
+        edge. Returns True on motion, False on timeout, and None when no
+        edge-capable backend is active (pinctrl fallback, unsupported or
+        uninitialised sensor, ``use_interrupt: false`` in the motion config,
+        or an earlier wait that failed), in which case the caller should
+        sleep and poll as before.
+        """
+        if self._edge_wait_disabled or not self.is_supported():
+            return None
+        if not self._get_motion_config().get('use_interrupt', True):
+            return None
+        with self._lock:
+            if not self._ensure_initialized():
+                return None
+
+        try:
+            if self._gpiozero_sensor is not None:
+                return bool(self._gpiozero_sensor.wait_for_motion(timeout))
+            if self._gpio and not self._is_pi5:
+                timeout_ms = max(1, int(timeout * 1000))
+                channel = self._gpio.wait_for_edge(
+                    self._pin, self._gpio.RISING, timeout=timeout_ms
+                )
+                return channel is not None
+        except Exception as e:
+            # Edge detection can fail while plain reads still work (RPi.GPIO
+            # on Bookworm kernels), so fall back to polling for good rather
+            # than marking the sensor unhealthy.
+            self._edge_wait_disabled = True
+            self.logger.warning(
+                f"Motion edge wait failed, falling back to polling: {e}"
+            )
+        return None
+
     def cleanup(self):
         """Clean up GPIO resources."""
         with self._lock:
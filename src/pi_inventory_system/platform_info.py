@@ -1,7 +1,7 @@
 """Platform detection helpers shared across managers."""
 
 import logging
-import os
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -11,12 +11,25 @@ DEFAULT_PI_STRING = "raspberry pi"
 DEFAULT_PI5_STRING = "raspberry pi 5"
 
 
+@lru_cache(maxsize=8)
 def _read_model(model_file: str = DEFAULT_MODEL_FILE) -> Optional[str]:
-    if not os.path.exists(model_file):
-        return None
+    """Return the lower-cased board model string, read once per path.
+
+    The device-tree model cannot change while the process runs, so callers
+    that probe the platform repeatedly share a single read. A missing file
+    is cached as None; any other OSError propagates, and lru_cache does not
+    cache it, so the next probe reads again.
+    """
     try:
         with open(model_file, "r") as f:
             return f.read().lower()
+    except FileNotFoundError:
+        return None
+
+
+def _model(model_file: str) -> Optional[str]:
+    try:
+        return _read_model(model_file)
     except OSError as e:
         logger.warning(f"Could not read platform model file {model_file}: {e}")
         return None
@@ -24,10 +37,10 @@ def _read_model(model_file: str = DEFAULT_MODEL_FILE) -> Optional[str]:
 
 def is_raspberry_pi(model_file: str = DEFAULT_MODEL_FILE,
                     required_string: str = DEFAULT_PI_STRING) -> bool:
-    model = _read_model(model_file)
+    model = _model(model_file)
     return model is not None and required_string in model
 
 
 def is_raspberry_pi_5(model_file: str = DEFAULT_MODEL_FILE) -> bool:
-    model = _read_model(model_file)
+    model = _model(model_file)
     return model is not None and DEFAULT_PI5_STRING in model
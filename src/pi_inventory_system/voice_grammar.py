@@ -8,6 +8,7 @@ understands. Vocabulary is sourced from command_processor and item_normalizer
 so the grammar cannot drift from what interpret_command() actually parses.
 """
 
+import contextlib
 import logging
 import os
 import re
@@ -217,9 +218,10 @@ def get_grammar_path():
             # speech_recognition compiles the .jsgf to a .fsg next to it and
             # reuses the .fsg while it exists; a stale one would keep serving
             # the old vocabulary after this grammar changes.
-            fsg_path = os.path.join(_grammar_dir(), GRAMMAR_NAME + '.fsg')
-            if os.path.exists(fsg_path):
-                os.remove(fsg_path)
+            # One unlink, tolerating absence, rather than an exists() probe
+            # that can race with another process removing the file.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(_grammar_dir(), GRAMMAR_NAME + '.fsg'))
             _cached_path = path
             logger.info(f"Sphinx command grammar written to {path}")
             return path
@@ -194,11 +194,24 @@ class VoiceRecognitionManager:
             self._initialize_pyaudio()
             device_index = self._resolve_input_device_index(voice_config)
 
+            # Capturing at the decoder's 16 kHz skips the per-utterance
+            # resample in get_raw_data. The rate is passed through only when
+            # configured; PyAudio fails to open the stream if the device
+            # does not support it.
+            mic_kwargs = {}
+            sample_rate = voice_config.get('sample_rate')
+            if sample_rate is not None:
+                if (isinstance(sample_rate, bool) or not isinstance(sample_rate, int)
+                        or sample_rate <= 0):
+                    self.logger.warning(f"Invalid sample_rate {sample_rate!r}, ignoring")
+                else:
+                    mic_kwargs['sample_rate'] = sample_rate
+
             if device_index is not None:
-                self._microphone = sr.Microphone(device_index=device_index)
+                self._microphone = sr.Microphone(device_index=device_index, **mic_kwargs)
                 self.logger.info(f"Using microphone device index: {device_index}")
             else:
-                self._microphone = sr.Microphone()
+                self._microphone = sr.Microphone(**mic_kwargs)
                 self.logger.info("Using default system microphone")
             
             # Run the 1-second ambient-noise calibration only when the
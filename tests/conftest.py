@@ -1,104 +1,231 @@
 """Common test fixtures for the pi_inventory_system tests."""
 
+import sqlite3
+from copy import deepcopy
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
+from pi_inventory_system import display_manager
 from pi_inventory_system.config_manager import create_config_manager
 from pi_inventory_system.database_manager import create_database_manager
 
 
-def _build_mock_config():
-    mock_config = MagicMock()
-    mock_config.get_database_path.return_value = ':memory:'
-    mock_config.get_font_config.return_value = {
-        'path': '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
-        'size': 16,
-        'fallback_size': 12,
-    }
-    mock_config.get_layout_config.return_value = {
-        'items_per_row': 2,
-        'lozenge_width_margin': 30,
-        'lozenge_height': 40,
-        'spacing': 10,
-        'margin': 10,
-    }
-    mock_config.get_audio_config.return_value = {
-        'voice_recognition': {
-            'timeout': 5,
-            'phrase_time_limit': 10,
-            'engine': 'sphinx',
-            'device_index': None,
+@pytest.fixture(scope="session")
+def _config_template():
+    """Return values for each ConfigManager getter, built once per session."""
+    return MappingProxyType({
+        'get_database_path': ':memory:',
+        'get_font_config': {
+            'path': '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+            'size': 16,
+            'fallback_size': 12,
+        },
+        'get_layout_config': {
+            'items_per_row': 2,
+            'lozenge_width_margin': 30,
+            'lozenge_height': 40,
+            'spacing': 10,
+            'margin': 10,
+        },
+        'get_audio_config': {
+            'voice_recognition': {
+                'timeout': 5,
+                'phrase_time_limit': 10,
+                'engine': 'sphinx',
+                'device_index': None,
+            },
+            'text_to_speech': {
+                'rate': 150,
+                'volume': 0.9,
+                'voice_id': None,
+            },
+            'feedback_sounds': {
+                'success_sound': 'sounds/success.wav',
+                'error_sound': 'sounds/error.wav',
+            },
+        },
+        'get_command_config': {
+            'similarity_threshold': 0.8,
+            'special_quantities': {'a': 1, 'an': 1, 'few': 3, 'several': 3},
+        },
+        'get_system_config': {
+            'main_loop_delay': 0.1,
+            'log_level': 'INFO',
+            'enable_diagnostics': True,
         },
-        'text_to_speech': {
-            'rate': 150,
-            'volume': 0.9,
-            'voice_id': None,
+        'get_nlp_config': {
+            'spacy_model': 'en_core_web_sm',
+            'enable_spacy': True,
         },
-        'feedback_sounds': {
-            'success_sound': 'sounds/success.wav',
-            'error_sound': 'sounds/error.wav',
+        'get_database_advanced_config': {
+            'timeout': 30.0,
+            'wal_mode': 'WAL',
+            'cache_size': 1000,
+            'synchronous_mode': 'NORMAL',
+            'temp_store': 'memory',
         },
-    }
-    mock_config.get_command_config.return_value = {
-        'similarity_threshold': 0.8,
-        'special_quantities': {'a': 1, 'an': 1, 'few': 3, 'several': 3},
-    }
-    mock_config.get_system_config.return_value = {
-        'main_loop_delay': 0.1,
-        'log_level': 'INFO',
-        'enable_diagnostics': True,
-    }
-    mock_config.get_nlp_config.return_value = {
-        'spacy_model': 'en_core_web_sm',
-        'enable_spacy': True,
-    }
-    mock_config.get_database_advanced_config.return_value = {
-        'timeout': 30.0,
-        'wal_mode': 'WAL',
-        'cache_size': 1000,
-        'synchronous_mode': 'NORMAL',
-        'temp_store': 'memory',
-    }
-    mock_config.get_platform_config.return_value = {
-        'raspberry_pi_model_file': '/proc/device-tree/model',
-        'required_pi_string': 'raspberry pi',
-    }
-    mock_config.get_hardware_config.return_value = {
-        'motion_sensor': {'enabled': True, 'pin': 4},
-    }
-    mock_config.get.return_value = {}
-    return mock_config
+        'get_platform_config': {
+            'raspberry_pi_model_file': '/proc/device-tree/model',
+            'required_pi_string': 'raspberry pi',
+        },
+        'get_hardware_config': {
+            'motion_sensor': {'enabled': True, 'pin': 4},
+        },
+        'get': {},
+    })
+
+
+class FakeConfigManager:
+    """Plain ConfigManager stand-in: every getter returns its section.
+
+    Cheaper than a MagicMock, which builds child mocks and records calls on
+    every access. Tests change a getter's result by assigning
+    ``sections[method_name]``.
+    """
+
+    def __init__(self, sections):
+        self.sections = sections
+
+    def __getattr__(self, name):
+        try:
+            value = self.__dict__['sections'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return lambda *args, **kwargs: value
 
 
 @pytest.fixture
-def mock_config_manager():
-    """Stand-alone mock config manager for tests that take it explicitly."""
-    return _build_mock_config()
+def mock_config_manager(_config_template):
+    """Stand-alone config manager for tests that take it explicitly.
+
+    Each test gets its own FakeConfigManager and deep copies of the template
+    sections, so tests may reassign or mutate them freely.
+    """
+    return FakeConfigManager(deepcopy(dict(_config_template)))
 
 
 @pytest.fixture
-def mock_raspberry_pi():
-    """Force display_manager._is_raspberry_pi to return True."""
-    with patch('pi_inventory_system.display_manager._is_raspberry_pi', return_value=True) as m:
+def mock_raspberry_pi(request):
+    """Patch display_manager._is_raspberry_pi for one test.
+
+    Returns True unless parametrized indirectly with the desired value; tests
+    should not reassign ``return_value`` on the yielded mock.
+    """
+    is_pi = getattr(request, 'param', True)
+    with patch('pi_inventory_system.display_manager._is_raspberry_pi', return_value=is_pi) as m:
         yield m
 
 
+@pytest.fixture(scope="session")
+def sample_inventory():
+    """Two (item_name, quantity) rows; a tuple so sharing it is safe."""
+    return (('Test Item 1', 5), ('Test Item 2', 3))
+
+
+@pytest.fixture
+def pil_mocks():
+    """Replace display_manager's PIL modules in one patch.multiple context.
+
+    Function-scoped on purpose: other tests in the same modules render with
+    real PIL, so the patch must not outlive the test that asked for it.
+    """
+    with patch.multiple(
+        'pi_inventory_system.display_manager',
+        Image=DEFAULT,
+        ImageDraw=DEFAULT,
+        ImageFont=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def _clear_display_caches():
+    """Empty display_manager's module-level font and template caches.
+
+    A pil_mocks test can cache a MagicMock template under a mock font key;
+    clearing around every test keeps it from reaching real-PIL tests.
+    """
+    display_manager._FONT_CACHE.clear()
+    display_manager._TEMPLATE_CACHE.clear()
+    yield
+    display_manager._FONT_CACHE.clear()
+    display_manager._TEMPLATE_CACHE.clear()
+
+
+@pytest.fixture(scope="session")
+def _migrated_snapshot(tmp_path_factory):
+    """Migrate one on-disk database per session and keep an in-memory copy.
+
+    The copy is taken with sqlite3's backup API, so each test can start
+    from the migrated schema without re-running the migration DDL.
+    """
+    db_path = tmp_path_factory.mktemp("db") / "migrated.db"
+    db_manager = create_database_manager(create_config_manager(), db_path=str(db_path))
+    snapshot = sqlite3.connect(":memory:")
+    db_manager._get_connection().backup(snapshot)
+    db_manager.cleanup()
+    yield snapshot
+    snapshot.close()
+
+
 @pytest.fixture
-def db_manager_instance(tmp_path):
-    """Create a real on-disk DatabaseManager bound to a tmp file."""
-    config = create_config_manager()
-    db_manager = create_database_manager(config, db_path=str(tmp_path / "test.db"))
+def db_manager_instance(_migrated_snapshot, tmp_path):
+    """Real on-disk DatabaseManager of its own, starting from the migrated
+    schema.
+
+    The session snapshot is restored into ``tmp_path / "test.db"`` before the
+    manager opens it, so the migration check finds nothing pending while
+    file-backed behaviour (path handling, journal mode, reopening) stays
+    under test.
+    """
+    db_path = tmp_path / "test.db"
+    target = sqlite3.connect(str(db_path))
+    try:
+        _migrated_snapshot.backup(target)
+    finally:
+        target.close()
+    db_manager = create_database_manager(create_config_manager(), db_path=str(db_path))
     yield db_manager
     db_manager.cleanup()
 
 
+@dataclass
+class FakeDisplay:
+    """Plain stand-in for WaveshareDisplay with only the surface the display
+    code touches; cheaper than a MagicMock that grows attributes on access."""
+    WIDTH: int = 800
+    HEIGHT: int = 480
+    display_image: MagicMock = field(default_factory=MagicMock)
+    clear: MagicMock = field(default_factory=MagicMock)
+    cleanup: MagicMock = field(default_factory=MagicMock)
+
+
+@dataclass
+class FakeDraw:
+    """Plain ImageDraw stand-in for tests that only need a fixed text bbox
+    and never assert on draw calls."""
+    bbox: tuple = (0, 0, 100, 20)
+
+    def textbbox(self, *args, **kwargs):
+        return self.bbox
+
+    def rounded_rectangle(self, *args, **kwargs):
+        pass
+
+    def text(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def fake_draw():
+    """FakeDraw returning a (0, 0, 100, 20) bbox; tests may override .bbox."""
+    return FakeDraw()
+
+
 @pytest.fixture
 def mock_display():
-    """MagicMock with the WaveshareDisplay surface area tests rely on."""
-    display = MagicMock()
-    display.WIDTH = 800
-    display.HEIGHT = 480
-    display.display_image = MagicMock()
-    display.clear = MagicMock()
-    display.cleanup = MagicMock()
-    return display
+    """FakeDisplay exposing the WaveshareDisplay surface area tests rely on."""
+    return FakeDisplay()
@@ -8,6 +8,13 @@ import pytest
 from pi_inventory_system.audio_feedback_manager import AudioFeedbackManager
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _no_tts_backend():
+    """Default every test to "pyttsx3 not installed"; the TTS tests opt back in."""
+    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False):
+        yield
+
+
 @pytest.fixture
 def cfg():
     cm = MagicMock()
@@ -22,15 +29,13 @@ def cfg():
 
 
 def test_play_sound_returns_false_when_file_missing(cfg):
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False), \
-         patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True):
+    with patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True):
         manager = AudioFeedbackManager(config_manager=cfg)
         assert manager.play_sound('success') is False
 
 
 def test_play_sound_returns_false_when_unknown_type(cfg):
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False), \
-         patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True):
+    with patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True):
         manager = AudioFeedbackManager(config_manager=cfg)
         assert manager.play_sound('rocketlaunch') is False
 
@@ -43,8 +48,7 @@ def test_warning_sound_falls_back_to_error_sound(cfg, tmp_path):
         'text_to_speech': {'rate': 150, 'volume': 0.9, 'voice_id': None},
     }
 
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False), \
-         patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True), \
+    with patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True), \
          patch('pi_inventory_system.audio_feedback_manager._play_wav_file') as play_wav:
         manager = AudioFeedbackManager(config_manager=cfg)
         assert manager.play_sound('warning') is True
@@ -52,17 +56,15 @@ def test_warning_sound_falls_back_to_error_sound(cfg, tmp_path):
 
 
 def test_play_sound_returns_false_when_no_backend(cfg):
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False), \
-         patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', False), \
+    with patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', False), \
          patch('pi_inventory_system.audio_feedback_manager.shutil.which', return_value=None):
         manager = AudioFeedbackManager(config_manager=cfg)
         assert manager.play_sound('success') is False
 
 
 def test_speak_returns_false_when_tts_unavailable(cfg):
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False):
-        manager = AudioFeedbackManager(config_manager=cfg)
-        assert manager.speak("hello") is False
+    manager = AudioFeedbackManager(config_manager=cfg)
+    assert manager.speak("hello") is False
 
 
 def test_speak_returns_false_when_tts_initialization_fails(cfg):
@@ -73,8 +75,7 @@ def test_speak_returns_false_when_tts_initialization_fails(cfg):
 
 
 def test_output_confirmation_combines_speech_and_success_sound(cfg):
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False):
-        manager = AudioFeedbackManager(config_manager=cfg)
+    manager = AudioFeedbackManager(config_manager=cfg)
     manager.speak = MagicMock(return_value=True)
     manager.play_sound = MagicMock(return_value=True)
 
@@ -84,8 +85,7 @@ def test_output_confirmation_combines_speech_and_success_sound(cfg):
 
 
 def test_output_error_reports_failure_when_sound_fails(cfg):
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False):
-        manager = AudioFeedbackManager(config_manager=cfg)
+    manager = AudioFeedbackManager(config_manager=cfg)
     manager.speak = MagicMock(return_value=True)
     manager.play_sound = MagicMock(return_value=False)
 
@@ -101,8 +101,7 @@ def test_circuit_breaker_disables_after_repeated_failures(cfg, tmp_path):
         'feedback_sounds': {'success_sound': str(sound)},
         'text_to_speech': {'rate': 150, 'volume': 0.9, 'voice_id': None},
     }
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False), \
-         patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True), \
+    with patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True), \
          patch('pi_inventory_system.audio_feedback_manager._play_wav_file',
                side_effect=RuntimeError("bad")):
         manager = AudioFeedbackManager(config_manager=cfg)
@@ -119,8 +118,7 @@ def test_circuit_breaker_disables_after_repeated_failures(cfg, tmp_path):
 def test_output_plays_chime_before_speech(cfg, method, sound):
     """The chime is the attention cue; it must precede the spoken message,
     not fire over it while the async TTS worker is still dequeuing."""
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False):
-        manager = AudioFeedbackManager(config_manager=cfg)
+    manager = AudioFeedbackManager(config_manager=cfg)
     order = []
     manager.play_sound = MagicMock(side_effect=lambda t: order.append(('sound', t)) or True)
     manager.speak = MagicMock(side_effect=lambda m: order.append(('speak', m)) or True)
@@ -140,8 +138,7 @@ def test_play_sound_marks_output_active_during_playback_and_grace(cfg, tmp_path)
         'feedback_sounds': {'success_sound': str(sound)},
         'text_to_speech': {'rate': 150, 'volume': 0.9, 'voice_id': None},
     }
-    with patch('pi_inventory_system.audio_feedback_manager.PYTTSX3_AVAILABLE', False), \
-         patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True):
+    with patch('pi_inventory_system.audio_feedback_manager.SIMPLEAUDIO_AVAILABLE', True):
         manager = AudioFeedbackManager(config_manager=cfg)
         assert manager.is_output_active() is False
 
@@ -1,17 +1,15 @@
 # Tests for command processor
 
 import pytest
-from unittest.mock import MagicMock
 from pi_inventory_system.command_processor import interpret_command
 from pi_inventory_system.inventory_item import InventoryItem
 
 @pytest.fixture
-def mock_config_manager():
-    """Mock the config manager."""
-    config_manager = MagicMock()
-    config_manager.get_command_config.return_value = {}
-    config_manager.get_nlp_config.return_value = {'enable_spacy': False}
-    return config_manager
+def mock_config_manager(mock_config_manager):
+    """Shared config manager with spaCy disabled and no command overrides."""
+    mock_config_manager.sections['get_command_config'] = {}
+    mock_config_manager.sections['get_nlp_config'] = {'enable_spacy': False}
+    return mock_config_manager
 
 def test_add_command(mock_config_manager):
     command_type, item = interpret_command("Add 3 chicken tenders", mock_config_manager)
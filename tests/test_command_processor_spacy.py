@@ -1,4 +1,9 @@
 # Tests for the spaCy integration in the command processor
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +20,14 @@ def reset_nlp_globals():
     pi_inventory_system.command_processor._nlp_load_failures = 0
     yield
 
+
+@pytest.fixture(autouse=True)
+def fake_spacy_module(monkeypatch):
+    """spaCy is imported lazily; install a stand-in so tests can patch load()."""
+    monkeypatch.setattr(
+        pi_inventory_system.command_processor, "spacy", SimpleNamespace(load=None)
+    )
+
 @pytest.fixture
 def spacy_config_manager():
     """Mock the config manager to enable spaCy."""
@@ -29,14 +42,17 @@ def create_mock_doc(tokens):
     Factory function to create a mock spaCy Doc object from a list of token dicts.
     Each token dict should have 'text' and 'lemma_'.
     """
-    mock_tokens = []
-    for token_data in tokens:
-        mock_token = MagicMock()
-        mock_token.text = token_data["text"]
-        mock_token.lemma_ = token_data["lemma_"]
-        # Set a default, as the code checks this attribute
-        mock_token.pos_ = token_data.get("pos_", "VERB")
-        mock_tokens.append(mock_token)
+    # Tokens are plain attribute bags; nothing asserts on them, so they don't
+    # need the per-instance bookkeeping a MagicMock carries.
+    mock_tokens = [
+        SimpleNamespace(
+            text=token_data["text"],
+            lemma_=token_data["lemma_"],
+            # Set a default, as the code checks this attribute
+            pos_=token_data.get("pos_", "VERB"),
+        )
+        for token_data in tokens
+    ]
 
     # The 'doc' object is iterable
     mock_doc = MagicMock()
@@ -182,3 +198,25 @@ def test_spacy_transient_failure_retries_before_cap(mock_spacy_load, spacy_confi
     assert pi_inventory_system.command_processor._ensure_nlp(spacy_config_manager) is mock_nlp
     assert pi_inventory_system.command_processor._ensure_nlp(spacy_config_manager) is mock_nlp
     assert mock_spacy_load.call_count == 2
+
+
+def test_importing_command_processor_does_not_import_spacy():
+    """The spaCy import is deferred to the first command that needs it."""
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, pi_inventory_system.command_processor; "
+         "sys.exit('spacy' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        # pytest's configured pythonpath lives only in this process's sys.path.
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_spacy_disabled_in_config_skips_import(spacy_config_manager, monkeypatch):
+    spacy_config_manager.get_nlp_config.return_value = {"enable_spacy": False}
+    monkeypatch.setattr(pi_inventory_system.command_processor, "spacy", None)
+    with patch("pi_inventory_system.command_processor._import_spacy") as mock_import:
+        assert pi_inventory_system.command_processor._ensure_nlp(spacy_config_manager) is None
+    mock_import.assert_not_called()
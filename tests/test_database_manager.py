@@ -1,6 +1,7 @@
 """Tests for the DatabaseManager — migrations, CRUD, undo, transactions."""
 
 import sqlite3
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -26,13 +27,87 @@ def test_migrations_idempotent(db_manager_instance):
     assert "004_inventory_quantity_constraints.sql" in first
 
 
-def test_migrations_applied_tables_exist(db_manager_instance):
-    conn = db_manager_instance._get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    tables = {row['name'] for row in cur.fetchall()}
-    cur.close()
+def test_migrations_applied_tables_exist():
+    """A fresh in-memory manager builds the full schema; the shared fixture
+    database was migrated once at session start, so check a new one."""
+    from pi_inventory_system.config_manager import create_config_manager
+    from pi_inventory_system.database_manager import create_database_manager
+
+    db_manager = create_database_manager(create_config_manager(), db_path=":memory:")
+    try:
+        conn = db_manager._get_connection()
+        rows = conn.execute("SELECT type, name FROM sqlite_master").fetchall()
+    finally:
+        db_manager.cleanup()
+    tables = {row['name'] for row in rows if row['type'] == 'table'}
+    triggers = {row['name'] for row in rows if row['type'] == 'trigger'}
     assert {'inventory', 'inventory_history', 'migrations'} <= tables
+    assert 'inventory_touch_last_modified' in triggers
+
+
+def test_pending_migration_applies_once(monkeypatch):
+    """A migration missing from the tracking table runs and is recorded once.
+
+    The script is fed in through _list_migrations, so no migration file has
+    to be written to disk.
+    """
+    from pi_inventory_system.config_manager import create_config_manager
+    from pi_inventory_system.database_manager import DatabaseManager, create_database_manager
+
+    db_manager = create_database_manager(create_config_manager(), db_path=":memory:")
+    shipped = db_manager._list_migrations()
+    extra = ("999_test_migration.sql", "CREATE TABLE test (id INTEGER PRIMARY KEY);")
+    monkeypatch.setattr(DatabaseManager, "_list_migrations", lambda self: shipped + [extra])
+    try:
+        conn = db_manager._get_connection()
+        db_manager._run_migrations(conn)
+        db_manager._run_migrations(conn)
+        applied = conn.execute(
+            "SELECT COUNT(*) FROM migrations WHERE migration_name = ?", (extra[0],)
+        ).fetchone()[0]
+        table = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'test'"
+        ).fetchone()
+    finally:
+        db_manager.cleanup()
+    assert applied == 1
+    assert table is not None
+
+
+def test_migration_scripts_read_once_per_process(db_manager_instance, monkeypatch):
+    """Every manager shares the packaged scripts instead of re-reading them."""
+    from pi_inventory_system import database_manager
+
+    monkeypatch.setattr(database_manager, "_MIGRATION_CACHE", {})
+    files = MagicMock(wraps=database_manager.resources.files)
+    monkeypatch.setattr(database_manager.resources, "files", files)
+
+    first = db_manager_instance._list_migrations()
+    second = db_manager_instance._list_migrations()
+
+    files.assert_called_once()
+    assert first == second
+    assert [name for name, _ in first] == sorted(name for name, _ in first)
+
+
+# Two bound parameters per row; stays under SQLite's default 999-variable cap.
+_SEED_BATCH = 250
+
+
+def _seed(db_manager, pairs):
+    """Insert pre-existing inventory rows with multi-row INSERTs.
+
+    Setup-only: bypasses add_item, so no history rows are written. Use it
+    for tests that need stock on hand, not an undoable past.
+    """
+    with db_manager._lock, db_manager._transaction() as conn:
+        for start in range(0, len(pairs), _SEED_BATCH):
+            batch = pairs[start:start + _SEED_BATCH]
+            placeholders = ",".join(["(?, ?)"] * len(batch))
+            conn.execute(
+                f"INSERT INTO inventory (item_name, quantity) VALUES {placeholders}",
+                [value for pair in batch for value in pair],
+            )
 
 
 def test_add_creates_history_row(db_manager_instance):
@@ -53,7 +128,7 @@ def test_add_creates_history_row(db_manager_instance):
 
 
 def test_remove_clamps_to_zero_and_deletes(db_manager_instance):
-    db_manager_instance.add_item("salmon", 2)
+    _seed(db_manager_instance, [("salmon", 2)])
     assert db_manager_instance.remove_item("salmon", 5) is True
     assert db_manager_instance.get_current_quantity("salmon") == 0
     conn = db_manager_instance._get_connection()
@@ -63,8 +138,44 @@ def test_remove_clamps_to_zero_and_deletes(db_manager_instance):
     cur.close()
 
 
+def test_get_current_quantity_sees_writes_made_outside_the_manager(db_manager_instance):
+    """Quantities are read from SQLite every time, never from a value cache:
+    undo and any other writer on the same file must be visible at once."""
+    _seed(db_manager_instance, [("steak", 2)])
+    assert db_manager_instance.get_current_quantity("steak") == 2
+
+    conn = db_manager_instance._get_connection()
+    conn.execute("UPDATE inventory SET quantity = 7 WHERE item_name = ?", ("steak",))
+    assert db_manager_instance.get_current_quantity("steak") == 7
+
+
+class _StatementLog:
+    """Cursor stand-in that records each SQL string before forwarding it."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.statements = []
+
+    def execute(self, sql, params=()):
+        self.statements.append(sql)
+        return self._cursor.execute(sql, params)
+
+
+@pytest.mark.parametrize("existing", [False, True], ids=["new-item", "existing-item"])
+def test_set_inventory_quantity_is_a_single_statement(db_manager_instance, existing):
+    """New and existing rows are both written with one UPSERT round-trip."""
+    if existing:
+        _seed(db_manager_instance, [("salmon", 2)])
+    with db_manager_instance._lock, db_manager_instance._transaction() as conn:
+        cursor = _StatementLog(conn.cursor())
+        db_manager_instance._set_inventory_quantity(cursor, "salmon", 5)
+
+    assert len(cursor.statements) == 1
+    assert db_manager_instance.get_current_quantity("salmon") == 5
+
+
 def test_set_zero_deletes_row(db_manager_instance):
-    db_manager_instance.add_item("steak", 4)
+    _seed(db_manager_instance, [("steak", 4)])
     db_manager_instance.set_item("steak", 0)
     assert db_manager_instance.get_current_quantity("steak") == 0
 
@@ -114,20 +225,13 @@ def test_undo_round_trip(db_manager_instance):
     assert db_manager_instance.get_current_quantity("steak") == 0
 
 
-def test_undo_restores_row_deleted_by_set_zero(db_manager_instance):
-    db_manager_instance.add_item("steak", 4)
-    db_manager_instance.set_item("steak", 0)
-
-    success, name = db_manager_instance.undo_last_change()
-
-    assert success is True
-    assert name == "steak"
-    assert db_manager_instance.get_current_quantity("steak") == 4
-
-
-def test_undo_restores_row_deleted_by_remove(db_manager_instance):
+@pytest.mark.parametrize("method,args", [
+    ("set_item", ("steak", 0)),
+    ("remove_item", ("steak", 10)),
+], ids=["set-zero", "remove"])
+def test_undo_restores_deleted_row(db_manager_instance, method, args):
     db_manager_instance.add_item("steak", 4)
-    db_manager_instance.remove_item("steak", 10)
+    getattr(db_manager_instance, method)(*args)
 
     success, name = db_manager_instance.undo_last_change()
 
@@ -143,34 +247,62 @@ def test_undo_with_no_history(db_manager_instance):
 
 
 def test_get_inventory_skips_zero_rows(db_manager_instance):
-    db_manager_instance.add_item("steak", 1)
-    db_manager_instance.add_item("salmon", 2)
+    _seed(db_manager_instance, [("steak", 1), ("salmon", 2)])
     db_manager_instance.set_item("salmon", 0)
     inventory = db_manager_instance.get_inventory()
     assert ("steak", 1) in inventory
     assert all(name != "salmon" for name, _ in inventory)
 
 
+def test_nested_transaction_is_rejected(db_manager_instance):
+    """Mutators never join an open transaction: a nested BEGIN fails and the
+    outer block rolls back."""
+    with pytest.raises(sqlite3.OperationalError):
+        with db_manager_instance._lock, db_manager_instance._transaction():
+            with db_manager_instance._transaction():
+                pass
+
+    conn = db_manager_instance._get_connection()
+    assert conn.in_transaction is False
+
+
+def test_write_transaction_takes_write_lock_up_front(db_manager_instance):
+    conn = db_manager_instance._get_connection()
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        db_manager_instance.add_item("steak", 1)
+    finally:
+        conn.set_trace_callback(None)
+
+    assert statements[0] == "BEGIN IMMEDIATE"
+    assert statements.count("BEGIN IMMEDIATE") == 1
+
+
 def test_last_modified_trigger_fires(db_manager_instance):
-    db_manager_instance.add_item("steak", 1)
+    """The UPSERT's DO UPDATE branch must still fire the last_modified trigger."""
+    _seed(db_manager_instance, [("steak", 1)])
     conn = db_manager_instance._get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT last_modified FROM inventory WHERE item_name = ?", ("steak",))
-    before = cur.fetchone()['last_modified']
-    cur.close()
+    # Backdate the row so the check does not depend on CURRENT_TIMESTAMP's
+    # one-second resolution.
+    with db_manager_instance._lock, db_manager_instance._transaction():
+        conn.execute(
+            "UPDATE inventory SET last_modified = '2000-01-01 00:00:00' "
+            "WHERE item_name = ?",
+            ("steak",),
+        )
 
-    cur = conn.cursor()
-    cur.execute("UPDATE inventory SET quantity = 99 WHERE item_name = ?", ("steak",))
-    cur.execute("SELECT last_modified FROM inventory WHERE item_name = ?", ("steak",))
-    after = cur.fetchone()['last_modified']
-    cur.close()
-    assert after >= before
+    db_manager_instance.add_item("steak", 2)
+
+    row = conn.execute(
+        "SELECT quantity, last_modified FROM inventory WHERE item_name = ?", ("steak",)
+    ).fetchone()
+    assert row['quantity'] == 3
+    assert row['last_modified'] > '2000-01-01 00:00:00'
 
 
 def test_add_item_propagates_database_error(db_manager_instance, monkeypatch):
     """sqlite3.Error inside add_item surfaces as DatabaseError, not silent False."""
-    import sqlite3
-
     from pi_inventory_system.exceptions import DatabaseError
 
     def boom(*args, **kwargs):
@@ -185,10 +317,8 @@ def test_undo_groups_multi_row_action(db_manager_instance):
     """Two history rows with the same action_id must undo together."""
     db_manager_instance.add_item("steak", 4)
 
-    conn = db_manager_instance._get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("BEGIN")
+    with db_manager_instance._lock, db_manager_instance._transaction() as conn:
+        cur = conn.cursor()
         action_id = db_manager_instance._next_action_id(cur)
         # Simulate a future bulk action that mutates two items in one call.
         cur.execute(
@@ -201,9 +331,6 @@ def test_undo_groups_multi_row_action(db_manager_instance):
         )
         db_manager_instance._record_history(cur, "steak", 4, 5, "add", action_id)
         db_manager_instance._record_history(cur, "salmon", 0, 2, "add", action_id)
-        conn.commit()
-    finally:
-        cur.close()
 
     assert db_manager_instance.get_current_quantity("steak") == 5
     assert db_manager_instance.get_current_quantity("salmon") == 2
@@ -217,23 +344,17 @@ def test_undo_groups_multi_row_action(db_manager_instance):
 
 def test_undo_falls_back_to_legacy_rows(db_manager_instance):
     """Pre-action_id rows (action_id = 0) still undo one at a time."""
-    conn = db_manager_instance._get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("BEGIN")
-        cur.execute(
+    with db_manager_instance._lock, db_manager_instance._transaction() as conn:
+        conn.execute(
             "INSERT INTO inventory (item_name, quantity) VALUES (?, ?)",
             ("legacy", 3),
         )
-        cur.execute(
+        conn.execute(
             """INSERT INTO inventory_history
                (item_name, previous_quantity, new_quantity, operation_type, action_id)
                VALUES (?, ?, ?, ?, 0)""",
             ("legacy", 0, 3, "add"),
         )
-        conn.commit()
-    finally:
-        cur.close()
 
     success, name = db_manager_instance.undo_last_change()
     assert success is True
@@ -251,6 +372,27 @@ def test_resolve_db_path_expands_user_and_creates_parent(tmp_path, monkeypatch):
     assert expected.parent.is_dir()
 
 
+def test_file_backed_database_uses_wal_and_normal_sync(tmp_path):
+    """On-disk databases get WAL + synchronous=NORMAL from the default config,
+    so each commit is a WAL append rather than a full fsync of the main file."""
+    from pi_inventory_system.config_manager import create_config_manager
+    from pi_inventory_system.database_manager import create_database_manager
+
+    db_manager = create_database_manager(
+        create_config_manager(), db_path=str(tmp_path / "pragmas.db")
+    )
+    try:
+        conn = db_manager._get_connection()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+    finally:
+        db_manager.cleanup()
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+    assert temp_store == 2  # MEMORY
+
+
 def test_resolve_db_path_passes_through_memory():
     from pi_inventory_system.database_manager import DatabaseManager
     assert DatabaseManager._resolve_db_path(":memory:") == ":memory:"
@@ -1,17 +1,19 @@
 """Tests for the diagnostics module."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from pi_inventory_system.diagnostics import run_startup_diagnostics
 
+_STARTUP_TEXT = "FridgePinventory\nstarting up..."
+_ALL_OK_STATUS = "Diagnostics complete:\nDisplay: OK\nMotion: OK\nAudio: OK"
+
 
 @pytest.fixture
-def mock_display_init():
+def mock_display_init(mock_display):
     with patch('pi_inventory_system.diagnostics.initialize_display') as init:
-        display = MagicMock()
-        init.return_value = display
-        yield display
+        init.return_value = mock_display
+        yield mock_display
 
 
 @pytest.fixture
@@ -58,11 +60,27 @@ def test_diagnostics_display_success(
         assert (display_ok, motion_ok, audio_ok) == (True, True, True)
         mock_text.assert_called_once_with(
             mock_display_init,
-            "Diagnostics complete:\nDisplay: OK\nMotion: OK\nAudio: OK",
+            _ALL_OK_STATUS,
             config_manager=cfg,
         )
 
 
+def test_diagnostics_shows_startup_message_when_enabled(
+    mock_display_init,
+    mock_motion_manager,
+    mock_supported,
+    mock_audio,
+    cfg,
+):
+    cfg.get.return_value = True
+    with patch('pi_inventory_system.diagnostics.display_text', return_value=True) as mock_text:
+        run_startup_diagnostics(cfg)
+    mock_text.assert_has_calls([
+        call(mock_display_init, _STARTUP_TEXT, config_manager=cfg),
+        call(mock_display_init, _ALL_OK_STATUS, config_manager=cfg),
+    ])
+
+
 def test_diagnostics_display_failure(
     mock_display_init,
     mock_motion_manager,
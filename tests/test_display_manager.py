@@ -3,116 +3,94 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from PIL import Image, ImageFont
-import pi_inventory_system.display_manager
+from pi_inventory_system import display_manager as dm
 import pi_inventory_system.waveshare_display as waveshare_display
 from pi_inventory_system.waveshare_display import WaveshareDisplay
 
 @pytest.fixture
-def mock_config_manager():
-    """Mock the config manager."""
-    config_manager = MagicMock()
-    config_manager.get_platform_config.return_value = {}
-    config_manager.get_hardware_config.return_value = {'display': {'enabled': True}}
-    config_manager.get_layout_config.return_value = {}
-    config_manager.get_display_config.return_value = {'colors': {}}
-    config_manager.get_font_config.return_value = {'path': 'dummy_font.ttf'}
-    config_manager.get.return_value = {}
-    return config_manager
-
-def test_is_display_supported(mock_config_manager):
+def mock_config_manager(mock_config_manager):
+    """Shared config manager with display-specific sections."""
+    mock_config_manager.sections.update({
+        'get_platform_config': {},
+        'get_hardware_config': {'display': {'enabled': True}},
+        'get_layout_config': {},
+        'get_display_config': {'colors': {}},
+        'get_font_config': {'path': 'dummy_font.ttf'},
+        'get': {},
+    })
+    return mock_config_manager
+
+@pytest.mark.parametrize('mock_raspberry_pi', [True, False], indirect=True)
+def test_is_display_supported(mock_config_manager, mock_raspberry_pi):
     """Test display support detection."""
-    with patch('pi_inventory_system.display_manager._is_raspberry_pi') as mock_is_pi:
-        mock_is_pi.return_value = True
-        assert pi_inventory_system.display_manager.is_display_supported(mock_config_manager)
-    
-    with patch('pi_inventory_system.display_manager._is_raspberry_pi') as mock_is_pi:
-        mock_is_pi.return_value = False
-        assert not pi_inventory_system.display_manager.is_display_supported(mock_config_manager)
+    assert dm.is_display_supported(mock_config_manager) is mock_raspberry_pi.return_value
 
 
 def test_is_display_supported_honors_disabled_config():
     config_manager = MagicMock()
     config_manager.get_hardware_config.return_value = {'display': {'enabled': False}}
-    assert not pi_inventory_system.display_manager.is_display_supported(config_manager)
+    assert not dm.is_display_supported(config_manager)
 
-def test_initialize_display(mock_config_manager): 
+def test_initialize_display(mock_config_manager):
     """Test display initialization."""
     with patch('pi_inventory_system.display_manager.is_display_supported', return_value=True), \
-         patch('pi_inventory_system.display_manager.WaveshareDisplay') as mock_waveshare_class:
-        mock_display_instance = MagicMock(name="mock_waveshare_display")
+         patch('pi_inventory_system.display_manager.WaveshareDisplay',
+               autospec=True) as mock_waveshare_class:
+        # autospec builds the instance from WaveshareDisplay itself, so a
+        # renamed or re-signatured driver method fails here, not on the Pi.
+        mock_display_instance = mock_waveshare_class.return_value
         mock_display_instance.initialize.return_value = True
-        mock_display_instance.WIDTH = 800
-        mock_display_instance.HEIGHT = 480
-        mock_waveshare_class.return_value = mock_display_instance
 
-        display = pi_inventory_system.display_manager.initialize_display(mock_config_manager)
+        display = dm.initialize_display(mock_config_manager)
 
         assert display is mock_display_instance
-        mock_waveshare_class.assert_called_once()
-        mock_display_instance.initialize.assert_called_once()
+        mock_waveshare_class.assert_called_once_with(config_manager=mock_config_manager)
+        mock_display_instance.initialize.assert_called_once_with()
 
-def test_display_inventory(mock_config_manager):
+def test_display_inventory(
+    mock_config_manager, mock_display, pil_mocks, fake_draw, sample_inventory
+):
     """Test inventory display."""
-    mock_display = MagicMock()
-    mock_display.WIDTH = 800
-    mock_display.HEIGHT = 480
-    mock_display.display_image = MagicMock()
-    inventory = [('Test Item 1', 5), ('Test Item 2', 3)]
-
-    with patch('pi_inventory_system.display_manager.Image'), \
-         patch('pi_inventory_system.display_manager.ImageDraw') as mock_draw, \
-         patch('pi_inventory_system.display_manager.ImageFont'):
-        mock_draw_instance = MagicMock()
-        mock_draw_instance.textbbox.return_value = (0, 0, 100, 20)
-        mock_draw.Draw.return_value = mock_draw_instance
-
-        result = pi_inventory_system.display_manager.display_inventory(
-            mock_display,
-            inventory,
-            mock_config_manager,
-        )
+    pil_mocks['ImageDraw'].Draw.return_value = fake_draw
 
-        mock_display.display_image.assert_called_once()
-        assert result is True
+    result = dm.display_inventory(
+        mock_display,
+        sample_inventory,
+        mock_config_manager,
+    )
+
+    mock_display.display_image.assert_called_once()
+    assert result is True
 
 def test_display_inventory_no_display(mock_config_manager):
     """Test inventory display when no display is available."""
-    result = pi_inventory_system.display_manager.display_inventory(None, [], mock_config_manager)
+    result = dm.display_inventory(None, [], mock_config_manager)
     assert result is False
 
 def test_initialize_display_no_raspberry_pi(mock_config_manager):
     """Test display initialization on non-Raspberry Pi."""
     with patch('pi_inventory_system.display_manager.is_display_supported', return_value=False):
-        display = pi_inventory_system.display_manager.initialize_display(mock_config_manager)
+        display = dm.initialize_display(mock_config_manager)
         assert display is None
 
-def test_display_text(mock_config_manager):
+def test_display_text(mock_config_manager, mock_display, pil_mocks, fake_draw):
     """Test text display on Waveshare display."""
-    mock_display = MagicMock()
-    mock_display.WIDTH = 800
-    mock_display.HEIGHT = 480
-    mock_display.display_image = MagicMock()
-    
-    with patch('pi_inventory_system.display_manager.Image'), \
-         patch('pi_inventory_system.display_manager.ImageDraw') as mock_draw, \
-         patch('pi_inventory_system.display_manager.ImageFont'):
-        mock_draw_instance = MagicMock()
-        mock_draw_instance.textbbox.return_value = (0, 0, 200, 30)
-        mock_draw.Draw.return_value = mock_draw_instance
-
-        result = pi_inventory_system.display_manager.display_text(
-            mock_display,
-            "Test Message",
-            mock_config_manager,
-            font_size=24,
-        )
-        
-        mock_display.display_image.assert_called_once()
-        assert result is True
+    fake_draw.bbox = (0, 0, 200, 30)
+    pil_mocks['ImageDraw'].Draw.return_value = fake_draw
+
+    result = dm.display_text(
+        mock_display,
+        "Test Message",
+        mock_config_manager,
+        font_size=24,
+    )
+
+    mock_display.display_image.assert_called_once()
+    assert result is True
 
 def test_display_text_no_display(mock_config_manager):
     """Test text display when no display is available."""
-    result = pi_inventory_system.display_manager.display_text(
+    result = dm.display_text(
         None,
         "Test Message",
         mock_config_manager,
@@ -122,9 +100,9 @@ def test_display_text_no_display(mock_config_manager):
 
 def test_cleanup_display_does_not_clear_by_default(mock_config_manager):
     display = MagicMock()
-    mock_config_manager.get.return_value = False
+    mock_config_manager.sections['get'] = False
 
-    pi_inventory_system.display_manager.cleanup_display(display, mock_config_manager)
+    dm.cleanup_display(display, mock_config_manager)
 
     display.clear.assert_not_called()
     display.cleanup.assert_called_once()
@@ -191,86 +169,52 @@ def test_waveshare_init_skips_test_pattern_by_default():
     assert display._display is display._epd_instance
 
 
-def test_lozenge_border_color():
+_COLORS = {
+    'background': 255,
+    'text': 0,
+    'border_normal': 0,
+    'border_low_stock': 128,
+    'low_stock_threshold': 2,
+}
+
+
+@pytest.mark.parametrize("colors,quantity,expected_outline", [
+    (_COLORS, 3, 0),
+    (_COLORS, 2, 128),
+    (_COLORS, 1, 128),
+    # Shipped config uses color names; they must resolve to gray levels.
+    ({**_COLORS, 'background': 'white', 'text': 'black', 'border_normal': 'black',
+      'border_low_stock': 'gray'}, 1, 128),
+], ids=["numeric-normal", "numeric-at-threshold", "numeric-low", "named-low"])
+def test_lozenge_border_color(colors, quantity, expected_outline):
     """Test lozenge border color changes based on quantity."""
     mock_draw = MagicMock()
-    mock_draw.rounded_rectangle = MagicMock()
     mock_draw.textbbox.return_value = (0, 0, 80, 20)
-    mock_draw.text = MagicMock()
     mock_font = MagicMock()
-    
-    colors = {
-        'background': 255,
-        'text': 0,
-        'border_normal': 0,
-        'border_low_stock': 128,
-        'low_stock_threshold': 2
-    }
-    
-    pi_inventory_system.display_manager.create_lozenge(
-        mock_draw,
-        0,
-        0,
-        100,
-        50,
-        "Test Item",
-        3,
-        mock_font,
-        colors,
-    )
-    mock_draw.rounded_rectangle.assert_called_with(
-        [(0, 0), (100, 50)], 
-        radius=12,
-        fill=255,
-        outline=0,
-        width=2
-    )
-    
-    mock_draw.reset_mock()
-    
-    pi_inventory_system.display_manager.create_lozenge(
-        mock_draw,
-        0,
-        0,
-        100,
-        50,
-        "Test Item",
-        2,
-        mock_font,
-        colors,
-    )
-    mock_draw.rounded_rectangle.assert_called_with(
-        [(0, 0), (100, 50)],
-        radius=12,
-        fill=255,
-        outline=128,
-        width=2
-    )
-    
-    mock_draw.reset_mock()
-    
-    pi_inventory_system.display_manager.create_lozenge(
+
+    dm.create_lozenge(
         mock_draw,
         0,
         0,
         100,
         50,
         "Test Item",
-        1,
+        quantity,
         mock_font,
         colors,
     )
-    mock_draw.rounded_rectangle.assert_called_with(
+    mock_draw.rounded_rectangle.assert_called_once_with(
         [(0, 0), (100, 50)],
         radius=12,
         fill=255,
-        outline=128,
+        outline=expected_outline,
         width=2
     )
+    assert mock_draw.text.call_args.kwargs['fill'] == 0
 
 
 def test_gray_value_resolves_names_and_numbers():
-    gray = pi_inventory_system.display_manager._gray_value
+    gray = dm._gray_value
     assert gray('white', 0) == 255
     assert gray('black', 255) == 0
     assert gray('gray', 0) == 128
@@ -284,82 +228,50 @@ def test_gray_value_resolves_names_and_numbers():
     assert gray('yellow', 0) == 226
 
 
-def test_lozenge_accepts_named_colors():
-    """Shipped config uses color names; they must resolve to gray levels."""
-    mock_draw = MagicMock()
-    mock_draw.textbbox.return_value = (0, 0, 80, 20)
-    mock_font = MagicMock()
-
-    colors = {
-        'background': 'white',
-        'text': 'black',
-        'border_normal': 'black',
-        'border_low_stock': 'gray',
-        'low_stock_threshold': 2,
-    }
-
-    pi_inventory_system.display_manager.create_lozenge(
-        mock_draw, 0, 0, 100, 50, "Test Item", 1, mock_font, colors,
-    )
-    mock_draw.rounded_rectangle.assert_called_with(
-        [(0, 0), (100, 50)],
-        radius=12,
-        fill=255,
-        outline=128,
-        width=2,
-    )
-    assert mock_draw.text.call_args.kwargs['fill'] == 0
-
-
 def test_default_config_low_stock_border_is_visible():
     """The shipped low-stock border color must render visibly darker than the
     white background on the grayscale panel (regression: 'yellow' -> 226)."""
     from pi_inventory_system.config_manager import DEFAULT_CONFIG
 
     colors = DEFAULT_CONFIG['display']['colors']
-    border = pi_inventory_system.display_manager._gray_value(
+    border = dm._gray_value(
         colors['border_low_stock'], 128
     )
-    background = pi_inventory_system.display_manager._gray_value(
+    background = dm._gray_value(
         colors['background'], 255
     )
     assert border <= 128
     assert background - border >= 64
 
 
-def test_load_font_uses_configured_size(mock_config_manager, tmp_path):
-    """display.font.size from config must be honored when no size is passed."""
+@pytest.fixture
+def stub_font_file(mock_config_manager, tmp_path):
+    """Point the font config at a stub 16pt file and start from a cold cache."""
     font_file = tmp_path / "font.ttf"
     font_file.write_bytes(b"stub")
-    mock_config_manager.get_font_config.return_value = {
+    mock_config_manager.sections['get_font_config'] = {
         'path': str(font_file),
         'size': 16,
     }
+    return font_file
 
-    pi_inventory_system.display_manager._FONT_CACHE.clear()
+
+def test_load_font_uses_configured_size(mock_config_manager, stub_font_file):
+    """display.font.size from config must be honored when no size is passed."""
     with patch('pi_inventory_system.display_manager.ImageFont') as mock_font:
         mock_font.truetype.return_value = MagicMock()
-        pi_inventory_system.display_manager._load_font(mock_config_manager)
+        dm._load_font(mock_config_manager)
 
-    mock_font.truetype.assert_called_once_with(str(font_file), 16)
+    mock_font.truetype.assert_called_once_with(str(stub_font_file), 16)
 
 
-def test_display_inventory_item_font_uses_configured_size(mock_config_manager, tmp_path):
+def test_display_inventory_item_font_uses_configured_size(
+    mock_config_manager, mock_display, stub_font_file
+):
     """Item lozenges must render with display.font.size, not a hardcoded 24."""
-    font_file = tmp_path / "font.ttf"
-    font_file.write_bytes(b"stub")
-    mock_config_manager.get_font_config.return_value = {
-        'path': str(font_file),
-        'size': 16,
-    }
-    mock_display = MagicMock()
-    mock_display.WIDTH = 800
-    mock_display.HEIGHT = 480
-
-    pi_inventory_system.display_manager._FONT_CACHE.clear()
     with patch('pi_inventory_system.display_manager.ImageFont') as mock_font:
         mock_font.truetype.return_value = ImageFont.load_default()
-        assert pi_inventory_system.display_manager.display_inventory(
+        assert dm.display_inventory(
             mock_display,
             [("salmon", 1)],
             mock_config_manager,
@@ -370,13 +282,48 @@ def test_display_inventory_item_font_uses_configured_size(mock_config_manager, t
     assert 24 in sizes  # header stays at its explicit size
 
 
+def test_display_inventory_reuses_cached_fonts_across_redraws(
+    mock_config_manager, mock_display, stub_font_file
+):
+    """TTF parsing is the dominant per-frame cost on the Pi; each (path, size)
+    must be loaded once and reused by later redraws."""
+    with patch('pi_inventory_system.display_manager.ImageFont') as mock_font:
+        mock_font.truetype.return_value = ImageFont.load_default()
+        for _ in range(3):
+            assert dm.display_inventory(
+                mock_display,
+                [("salmon", 1)],
+                mock_config_manager,
+            )
+
+    sizes = [call.args[1] for call in mock_font.truetype.call_args_list]
+    assert sorted(sizes) == sorted(set(sizes))
+
+
+def test_display_inventory_copies_cached_header_template(mock_config_manager, mock_display):
+    """The static header frame is rendered once and copied per redraw; the
+    cached template itself must never be drawn on."""
+    with patch('pi_inventory_system.display_manager._load_font',
+               return_value=ImageFont.load_default()):
+        assert dm.display_inventory(mock_display, [("salmon", 1)], mock_config_manager)
+        assert dm.display_inventory(mock_display, [("steak", 2)], mock_config_manager)
+
+    assert len(dm._TEMPLATE_CACHE) == 1
+    template = next(iter(dm._TEMPLATE_CACHE.values()))
+    first, second = (call.args[0] for call in mock_display.display_image.call_args_list)
+    assert first is not template and second is not template
+    # Header pixels come from the template; the lozenge area stays blank on it.
+    assert template.getextrema()[0] < 255
+    assert template.crop((0, 50, 800, 480)).getextrema() == (255, 255)
+    assert first.crop((0, 0, 800, 50)).tobytes() == template.crop((0, 0, 800, 50)).tobytes()
+
+
 def test_lozenge_ellipsizes_long_text():
     mock_draw = MagicMock()
     mock_draw.textbbox.side_effect = lambda _pos, text, font=None: (0, 0, len(text) * 10, 20)
     mock_font = MagicMock()
-    colors = {'background': 255, 'text': 0, 'border_normal': 0}
 
-    pi_inventory_system.display_manager.create_lozenge(
+    dm.create_lozenge(
         mock_draw,
         0,
         0,
@@ -385,7 +332,7 @@ def test_lozenge_ellipsizes_long_text():
         "very long freezer inventory item name",
         3,
         mock_font,
-        colors,
+        _COLORS,
     )
 
     rendered_text = mock_draw.text.call_args.args[1]
@@ -393,17 +340,13 @@ def test_lozenge_ellipsizes_long_text():
     assert len(rendered_text) * 10 <= 88
 
 
-def test_display_inventory_reports_overflow(mock_config_manager):
-    mock_display = MagicMock()
-    mock_display.WIDTH = 800
-    mock_display.HEIGHT = 480
-    mock_display.display_image = MagicMock()
+def test_display_inventory_reports_overflow(mock_config_manager, mock_display):
     inventory = [(f"Item {i}", i + 1) for i in range(21)]
 
     with patch('pi_inventory_system.display_manager.create_lozenge') as lozenge, \
          patch('pi_inventory_system.display_manager._load_font',
                return_value=ImageFont.load_default()):
-        assert pi_inventory_system.display_manager.display_inventory(
+        assert dm.display_inventory(
             mock_display,
             inventory,
             mock_config_manager,
@@ -413,21 +356,17 @@ def test_display_inventory_reports_overflow(mock_config_manager):
     assert rendered_names[-1] == "+2 more"
 
 
-def test_display_inventory_sanitizes_invalid_layout(mock_config_manager):
-    mock_config_manager.get_layout_config.return_value = {
+def test_display_inventory_sanitizes_invalid_layout(mock_config_manager, mock_display):
+    mock_config_manager.sections['get_layout_config'] = {
         'items_per_row': 0,
         'spacing': -1,
         'margin': -1,
         'lozenge_height': 0,
     }
-    mock_display = MagicMock()
-    mock_display.WIDTH = 800
-    mock_display.HEIGHT = 480
-    mock_display.display_image = MagicMock()
 
     with patch('pi_inventory_system.display_manager._load_font',
                return_value=ImageFont.load_default()):
-        assert pi_inventory_system.display_manager.display_inventory(
+        assert dm.display_inventory(
             mock_display,
             [("salmon", 1)],
             mock_config_manager,
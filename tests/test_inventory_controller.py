@@ -1,32 +1,71 @@
 import pytest
 import time
 from concurrent.futures import ThreadPoolExecutor
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
 from pi_inventory_system.config_manager import create_config_manager
 from pi_inventory_system.database_manager import create_database_manager
 from pi_inventory_system.exceptions import DisplayError
+from pi_inventory_system import inventory_controller
 from pi_inventory_system.inventory_controller import InventoryController
 from pi_inventory_system.inventory_item import InventoryItem
 
 
+# InventoryItem is an immutable tuple, so tests can share these instances.
+_CHICKEN_0 = InventoryItem(item_name="chicken", quantity=0)
+_CHICKEN_1 = InventoryItem(item_name="chicken", quantity=1)
+_CHICKEN_5 = InventoryItem(item_name="chicken", quantity=5)
+_CHICKEN_MAX = InventoryItem(item_name="chicken", quantity=10000)
+
+
+@pytest.fixture(scope="module")
+def _controller_instance():
+    """Build the mocked controller once per module; see ``controller``.
+
+    The db mock is injected directly, so get_default_db_manager is never
+    reached and needs no patch.
+    """
+    mock_db_manager = MagicMock()
+    controller_instance = InventoryController(
+        db_manager=mock_db_manager,
+        # Only passed through to display_inventory, which tests replace.
+        display=SimpleNamespace(),
+        config_manager=MagicMock(),
+    )
+    controller_instance.db = mock_db_manager
+    return controller_instance
+
+
 @pytest.fixture
-def controller():
-    """Create a controller instance with mocked dependencies."""
-    with patch(
-        'pi_inventory_system.inventory_controller.get_default_db_manager'
-    ) as mock_db_manager:
-        mock_display = Mock()
-        mock_config_manager = MagicMock()
-        mock_config_manager.get_command_config.return_value = {'similarity_threshold': 0.8}
-        controller_instance = InventoryController(
-            db_manager=mock_db_manager,
-            display=mock_display,
-            config_manager=mock_config_manager,
+def controller(_controller_instance):
+    """Hand out the shared controller with its mocks and render cache reset."""
+    for collaborator in (_controller_instance.db, _controller_instance.config_manager):
+        collaborator.reset_mock(return_value=True, side_effect=True)
+    _controller_instance.config_manager.get_command_config.return_value = {
+        'similarity_threshold': 0.8
+    }
+    # Default to empty inventory so the post-command refresh has a real list.
+    _controller_instance.db.get_inventory.return_value = []
+    _controller_instance._last_rendered_inventory = None
+    _controller_instance._last_rendered_at = None
+    return _controller_instance
+
+
+@pytest.fixture
+def patched(monkeypatch):
+    """Stub interpret_command to return a fixed result and make renders succeed.
+
+    A plain attribute swap is enough here; tests that inspect the render
+    call still patch display_inventory with a mock of their own.
+    """
+    def _apply(interpreted):
+        monkeypatch.setattr(
+            inventory_controller, 'interpret_command', lambda *args, **kwargs: interpreted
+        )
+        monkeypatch.setattr(
+            inventory_controller, 'display_inventory', lambda *args, **kwargs: True
         )
-        controller_instance.db = mock_db_manager
-        # Default to empty inventory so the post-command refresh has a real list.
-        mock_db_manager.get_inventory.return_value = []
-        return controller_instance
+    return _apply
 
 
 def test_process_command_empty_command(controller):
@@ -36,94 +75,82 @@ def test_process_command_empty_command(controller):
     assert feedback == "Could not understand audio. Please try again."
 
 
-def test_process_command_invalid_command(controller):
+def test_process_command_invalid_command(controller, patched):
     """Test processing an invalid command."""
-    with patch('pi_inventory_system.inventory_controller.interpret_command', 
-              return_value=(None, None)):
-        success, feedback = controller.process_command("invalid command")
-        assert not success
-        assert feedback == (
-            "Command not recognized. Please try again with add, remove, set, or undo."
-        )
+    patched((None, None))
+    success, feedback = controller.process_command("invalid command")
+    assert not success
+    assert feedback == (
+        "Command not recognized. Please try again with add, remove, set, or undo."
+    )
 
 
-def test_process_command_failed_execution(controller):
+def test_process_command_failed_execution(controller, patched):
     """Test processing a command that fails to execute."""
-    item = InventoryItem(item_name="chicken", quantity=1)
+    item = _CHICKEN_1
     controller.db.add_item.return_value = False  # Simulate failure
     controller._db_manager.get_current_quantity.return_value = 0  # Ensure limit guard doesn't fire
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("add", item)):
-        success, feedback = controller.process_command("add chicken")
-        assert not success
-        assert feedback == "Command failed to execute. Please check inventory and try again."
-
-
-def test_process_command_successful_add(controller):
-    """Test processing a successful add command."""
-    item = InventoryItem(item_name="chicken", quantity=1)
-    controller.db.add_item.return_value = True
-    # Mock the new return value for _execute_command
-    controller._db_manager.get_current_quantity.return_value = 1
-
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("add", item)), \
-         patch('pi_inventory_system.inventory_controller.display_inventory'):
-        success, feedback = controller.process_command("add chicken")
-        assert success
-        assert feedback == "chicken now has 1 in inventory."
-        controller.db.add_item.assert_called_with(item.item_name, item.quantity)
-
-
-def test_process_command_successful_remove(controller):
-    """Test processing a successful remove command."""
-    item = InventoryItem(item_name="chicken", quantity=1)
-    controller.db.remove_item.return_value = True
-    controller._db_manager.get_current_quantity.side_effect = [1, 0]
-
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("remove", item)), \
-         patch('pi_inventory_system.inventory_controller.display_inventory'):
-        success, feedback = controller.process_command("remove chicken")
-        assert success
-        assert feedback == "chicken has been removed from inventory."
-        controller.db.remove_item.assert_called_with(item.item_name, item.quantity)
+    patched(("add", item))
+    success, feedback = controller.process_command("add chicken")
+    assert not success
+    assert feedback == "Command failed to execute. Please check inventory and try again."
+
+
+@pytest.mark.parametrize("command_type,item,command,quantities,feedback", [
+    ("add", _CHICKEN_1, "add chicken", [0, 1], "chicken now has 1 in inventory."),
+    ("remove", _CHICKEN_1, "remove chicken", [1, 0],
+     "chicken has been removed from inventory."),
+    ("set", _CHICKEN_5, "set chicken to 5", [5], "chicken now has 5 in inventory."),
+])
+def test_process_command_success(
+    controller, patched, command_type, item, command, quantities, feedback
+):
+    """Each mutation reaches its DB method and reports the resulting quantity.
+
+    ``quantities`` are successive get_current_quantity results: the pre-check
+    (add/remove only) followed by the post-mutation read.
+    """
+    db_method = getattr(controller.db, f"{command_type}_item")
+    db_method.return_value = True
+    controller._db_manager.get_current_quantity.side_effect = quantities
+
+    patched((command_type, item))
+    success, message = controller.process_command(command)
+    assert success
+    assert message == feedback
+    db_method.assert_called_with(item.item_name, item.quantity)
 
 
-def test_process_command_remove_missing_item(controller):
+def test_process_command_remove_missing_item(controller, patched):
     """Removing a missing item should not report a successful mutation."""
-    item = InventoryItem(item_name="chicken", quantity=1)
+    item = _CHICKEN_1
     controller._db_manager.get_current_quantity.return_value = 0
 
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("remove", item)):
-        success, feedback = controller.process_command("remove chicken")
-        assert not success
-        assert feedback == "chicken is not in inventory."
-        controller.db.remove_item.assert_not_called()
+    patched(("remove", item))
+    success, feedback = controller.process_command("remove chicken")
+    assert not success
+    assert feedback == "chicken is not in inventory."
+    controller.db.remove_item.assert_not_called()
 
 
-def test_process_command_remove_all_clamps_to_zero(controller):
-    item = InventoryItem(item_name="chicken", quantity=10000)
+def test_process_command_remove_all_clamps_to_zero(controller, patched):
+    item = _CHICKEN_MAX
     controller._db_manager.get_current_quantity.side_effect = [3, 0]
     controller.db.remove_item.return_value = True
 
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("remove", item)), \
-         patch('pi_inventory_system.inventory_controller.display_inventory'):
-        success, feedback = controller.process_command("remove all chicken")
+    patched(("remove", item))
+    success, feedback = controller.process_command("remove all chicken")
 
     assert success
     assert feedback == "chicken has been removed from inventory."
     controller.db.remove_item.assert_called_with("chicken", 10000)
 
 
-def test_process_command_missing_item_has_specific_feedback(controller):
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("add", None)):
-        success, feedback = controller.process_command("add")
-        assert not success
-        assert feedback == "Could not identify a valid item and quantity. Please try again."
+def test_process_command_missing_item_has_specific_feedback(controller, patched):
+    patched(("add", None))
+    success, feedback = controller.process_command("add")
+    assert not success
+    assert feedback == "Could not identify a valid item and quantity. Please try again."
 
 
 def test_update_display_serialises_concurrent_renders(controller):
@@ -145,8 +172,7 @@ def test_update_display_serialises_concurrent_renders(controller):
         in_render.clear()
         return True
 
-    with patch('pi_inventory_system.inventory_controller.display_inventory',
-              side_effect=slow_render):
+    with patch.object(inventory_controller, 'display_inventory', side_effect=slow_render):
         t1 = threading.Thread(target=controller.update_display_with_inventory)
         t1.start()
         # Force the second call to see a different inventory so the dedup cache
@@ -158,57 +184,48 @@ def test_update_display_serialises_concurrent_renders(controller):
         t1.join(timeout=2)
         t2.join(timeout=2)
 
+    # The controller is module-scoped; a thread still rendering would hold
+    # its display lock into later tests.
+    assert not t1.is_alive() and not t2.is_alive()
     assert overlapped == []
 
 
-def test_process_command_set_to_zero_deletes(controller):
+def test_process_command_set_to_zero_deletes(controller, patched):
     """`set X to 0` must reach set_item — quantity 0 is the delete idiom for set."""
-    item = InventoryItem(item_name="chicken", quantity=0)
+    item = _CHICKEN_0
     controller.db.set_item.return_value = True
     controller._db_manager.get_current_quantity.return_value = 0
 
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("set", item)), \
-         patch('pi_inventory_system.inventory_controller.display_inventory'):
-        success, feedback = controller.process_command("set chicken to 0")
-        assert success
-        assert feedback == "chicken has been removed from inventory."
-        controller.db.set_item.assert_called_once_with("chicken", 0)
-
-
-def test_process_command_rejects_zero_remove(controller):
-    """`remove 0 X` is not valid even though it's syntactically harmless."""
-    item = InventoryItem(item_name="chicken", quantity=0)
-
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("remove", item)):
-        success, feedback = controller.process_command("remove 0 chicken")
-        assert not success
-        assert feedback == "Invalid item details. Please check the item name and quantity."
-        controller.db.remove_item.assert_not_called()
+    patched(("set", item))
+    success, feedback = controller.process_command("set chicken to 0")
+    assert success
+    assert feedback == "chicken has been removed from inventory."
+    controller.db.set_item.assert_called_once_with("chicken", 0)
 
 
-def test_process_command_rejects_zero_add(controller):
-    item = InventoryItem(item_name="chicken", quantity=0)
+@pytest.mark.parametrize("command_type", ["add", "remove"])
+def test_process_command_rejects_zero_quantity(controller, patched, command_type):
+    """`add 0 X` / `remove 0 X` are not valid even though they're syntactically harmless."""
+    item = _CHICKEN_0
 
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("add", item)):
-        success, feedback = controller.process_command("add 0 chicken")
-        assert not success
-        assert feedback == "Invalid item details. Please check the item name and quantity."
-        controller.db.add_item.assert_not_called()
+    patched((command_type, item))
+    success, feedback = controller.process_command(f"{command_type} 0 chicken")
+    assert not success
+    assert feedback == "Invalid item details. Please check the item name and quantity."
+    getattr(controller.db, f"{command_type}_item").assert_not_called()
 
 
 def test_process_command_success_when_display_refresh_fails(controller):
     """A display error after the DB mutation should not report command failure."""
-    item = InventoryItem(item_name="chicken", quantity=1)
+    item = _CHICKEN_1
     controller.db.add_item.return_value = True
     controller._db_manager.get_current_quantity.return_value = 1
 
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("add", item)), \
-         patch('pi_inventory_system.inventory_controller.display_inventory',
-               side_effect=RuntimeError("display offline")):
+    with patch.multiple(
+        inventory_controller,
+        interpret_command=MagicMock(return_value=("add", item)),
+        display_inventory=MagicMock(side_effect=RuntimeError("display offline")),
+    ):
         success, feedback = controller.process_command("add chicken")
         assert success
         assert feedback == "chicken now has 1 in inventory."
@@ -216,7 +233,7 @@ def test_process_command_success_when_display_refresh_fails(controller):
 
 def test_update_display_raises_when_render_returns_false(controller):
     controller.db.get_inventory.return_value = [("steak", 1)]
-    with patch('pi_inventory_system.inventory_controller.display_inventory', return_value=False):
+    with patch.object(inventory_controller, 'display_inventory', return_value=False):
         with pytest.raises(DisplayError):
             controller.update_display_with_inventory()
     assert controller._last_rendered_inventory is None
@@ -243,32 +260,15 @@ def test_process_command_from_executor_thread_updates_database(tmp_path):
         db.cleanup()
 
 
-def test_process_command_successful_undo(controller):
+def test_process_command_successful_undo(controller, patched):
     """Test processing a successful undo command."""
     controller._db_manager.undo_last_change.return_value = (True, "chicken")
 
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("undo", None)), \
-         patch('pi_inventory_system.inventory_controller.display_inventory'):
-        success, feedback = controller.process_command("undo")
-        assert success
-        assert feedback == "Last change for chicken has been undone."
-        controller.db.undo_last_change.assert_called_once()
-
-
-def test_process_command_successful_set(controller):
-    """Test processing a successful set command."""
-    item = InventoryItem(item_name="chicken", quantity=5)
-    controller.db.set_item.return_value = True
-    controller._db_manager.get_current_quantity.return_value = 5
-
-    with patch('pi_inventory_system.inventory_controller.interpret_command',
-              return_value=("set", item)), \
-         patch('pi_inventory_system.inventory_controller.display_inventory'):
-        success, feedback = controller.process_command("set chicken to 5")
-        assert success
-        assert feedback == "chicken now has 5 in inventory."
-        controller.db.set_item.assert_called_with(item.item_name, item.quantity)
+    patched(("undo", None))
+    success, feedback = controller.process_command("undo")
+    assert success
+    assert feedback == "Last change for chicken has been undone."
+    controller.db.undo_last_change.assert_called_once()
 
 
 def test_update_display_with_inventory(controller):
@@ -277,9 +277,7 @@ def test_update_display_with_inventory(controller):
     test_get_inventory_skips_zero_rows); the controller does not re-derive it."""
     controller.db.get_inventory.return_value = [("chicken breast", 2), ("steak", 1)]
 
-    with patch(
-        'pi_inventory_system.inventory_controller.display_inventory'
-    ) as mock_display_inventory:
+    with patch.object(inventory_controller, 'display_inventory') as mock_display_inventory:
         controller.update_display_with_inventory()
         actual_list = mock_display_inventory.call_args[0][1]
         assert actual_list == [('chicken breast', 2), ('steak', 1)]
@@ -288,29 +286,12 @@ def test_update_display_with_inventory(controller):
 def test_update_display_skips_when_unchanged(controller):
     """Re-rendering the same inventory does not call display_inventory twice."""
     controller.db.get_inventory.return_value = [("steak", 1)]
-    with patch(
-        'pi_inventory_system.inventory_controller.display_inventory'
-    ) as mock_display_inventory:
+    with patch.object(inventory_controller, 'display_inventory') as mock_display_inventory:
         controller.update_display_with_inventory()
         controller.update_display_with_inventory()
         assert mock_display_inventory.call_count == 1
 
 
-
-
-
-@pytest.mark.skip(reason="Loop-related tests are not critical and can be flaky")
-def test_run_loop_keyboard_interrupt(controller):
-    """Test handling keyboard interrupt in run loop."""
-    pass
-
-
-@pytest.mark.skip(reason="Loop-related tests are not critical and can be flaky")
-def test_run_loop_exception(controller):
-    """Test handling general exception in run loop."""
-    pass
-
-
 def test_undo_with_empty_history_reports_nothing_to_undo(controller):
     """Empty history is not a storage failure; tell the user plainly."""
     controller._db_manager.undo_last_change.return_value = (False, None)
@@ -18,3 +18,13 @@ def test_inventory_item_tuple_helpers():
     assert item.to_tuple() == ("salmon", 3)
     with pytest.raises(ValueError):
         InventoryItem.from_tuple(("salmon", 3, "extra"))
+
+
+def test_inventory_item_is_immutable_and_hashable():
+    item = InventoryItem(item_name="salmon", quantity=2)
+    with pytest.raises(AttributeError):
+        item.quantity = 3
+    assert item._replace(quantity=3) == InventoryItem("salmon", 3)
+    assert {item: True}[InventoryItem("salmon", 2)] is True
+    with pytest.raises(ValueError):
+        item._replace(quantity=-1)
@@ -1,65 +1,76 @@
 # Tests for item normalizer
 
 import pytest
-from unittest.mock import MagicMock
 from pi_inventory_system.item_normalizer import normalize_item_name, get_item_synonyms
 
-@pytest.fixture
-def mock_config_manager():
-    """Mock the config manager."""
-    config_manager = MagicMock()
-    config_manager.get_command_config.return_value = {'similarity_threshold': 0.8}
-    return config_manager
 
-def test_basic_normalization(mock_config_manager):
-    """Test basic item name normalization."""
-    assert normalize_item_name("ground beef", mock_config_manager) == "ground beef"
-    assert normalize_item_name("beef", mock_config_manager) == "ground beef"
-    assert normalize_item_name("ground meat", mock_config_manager) == "ground beef"
+@pytest.fixture(params=['default', 'with_config'])
+def config_source(request, mock_config_manager):
+    """Run a test both without a config manager and with the mock one."""
+    return None if request.param == 'default' else mock_config_manager
 
-def test_steak_normalization(mock_config_manager):
-    """Test steak variations."""
-    assert normalize_item_name("steak", mock_config_manager) == "steak"
-    assert normalize_item_name("steaks", mock_config_manager) == "steak"
-    assert normalize_item_name("sirloin", mock_config_manager) == "steak"
-    assert normalize_item_name("ribeye", mock_config_manager) == "steak"
+@pytest.mark.parametrize("raw,expected", [
+    ("ground beef", "ground beef"),
+    ("beef", "ground beef"),
+    ("ground meat", "ground beef"),
+    ("steak", "steak"),
+    ("steaks", "steak"),
+    ("sirloin", "steak"),
+    ("ribeye", "steak"),
+    ("chicken breast", "chicken breast"),
+    ("breast", "chicken breast"),
+    ("chicken tenders", "chicken tenders"),
+    ("tenders", "chicken tenders"),
+    ("chicken nuggets", "chicken nuggets"),
+    ("nuggets", "chicken nuggets"),
+    ("white fish", "white fish"),
+    ("whitefish", "white fish"),
+    ("white fish fillet", "white fish"),
+    ("tilapia", "white fish"),
+    ("salmon", "salmon"),
+    ("salmon fillet", "salmon"),
+    ("ground turkey", "ground turkey"),
+    ("turkey", "ground turkey"),
+    ("turkey meat", "ground turkey"),
+    ("ice cream", "ice cream"),
+    ("icecream", "ice cream"),
+    ("vanilla ice cream", "ice cream"),
+    ("ice cream tub", "ice cream"),
+    # Unknown items should return as-is
+    ("unknown item", "unknown item"),
+    ("random food", "random food"),
+])
+def test_normalization(config_source, raw, expected):
+    """Base names, synonyms and near-misses resolve to the canonical name."""
+    assert normalize_item_name(raw, config_source) == expected
 
-def test_chicken_normalization(mock_config_manager):
-    """Test chicken variations."""
-    assert normalize_item_name("chicken breast", mock_config_manager) == "chicken breast"
-    assert normalize_item_name("breast", mock_config_manager) == "chicken breast"
-    assert normalize_item_name("chicken tenders", mock_config_manager) == "chicken tenders"
-    assert normalize_item_name("tenders", mock_config_manager) == "chicken tenders"
-    assert normalize_item_name("chicken nuggets", mock_config_manager) == "chicken nuggets"
-    assert normalize_item_name("nuggets", mock_config_manager) == "chicken nuggets"
+def test_get_synonyms(config_source):
+    synonyms = get_item_synonyms("ground beef", config_source)
+    assert "beef" in synonyms
+    assert "ground meat" in synonyms
+    assert "ground beef" in synonyms
 
-def test_fish_normalization(mock_config_manager):
-    """Test fish variations."""
-    assert normalize_item_name("white fish", mock_config_manager) == "white fish"
-    assert normalize_item_name("whitefish", mock_config_manager) == "white fish"
-    assert normalize_item_name("white fish fillet", mock_config_manager) == "white fish"
-    assert normalize_item_name("tilapia", mock_config_manager) == "white fish"
-    assert normalize_item_name("salmon", mock_config_manager) == "salmon"
-    assert normalize_item_name("salmon fillet", mock_config_manager) == "salmon"
+def test_synonym_index_is_read_only():
+    from pi_inventory_system.item_normalizer import _SYNONYM_INDEX
 
-def test_turkey_normalization(mock_config_manager):
-    assert normalize_item_name("ground turkey", mock_config_manager) == "ground turkey"
-    assert normalize_item_name("turkey", mock_config_manager) == "ground turkey"
-    assert normalize_item_name("turkey meat", mock_config_manager) == "ground turkey"
+    assert _SYNONYM_INDEX["tilapia fillets"] == "white fish"
+    assert _SYNONYM_INDEX["salmon"] == "salmon"
+    with pytest.raises(TypeError):
+        _SYNONYM_INDEX["tilapia"] = "salmon"
 
-def test_ice_cream_normalization(mock_config_manager):
-    assert normalize_item_name("ice cream", mock_config_manager) == "ice cream"
-    assert normalize_item_name("icecream", mock_config_manager) == "ice cream"
-    assert normalize_item_name("vanilla ice cream", mock_config_manager) == "ice cream"
-    assert normalize_item_name("ice cream tub", mock_config_manager) == "ice cream"
 
-def test_get_synonyms(mock_config_manager):
-    synonyms = get_item_synonyms("ground beef", mock_config_manager)
-    assert "beef" in synonyms
-    assert "ground meat" in synonyms
-    assert "ground beef" in synonyms
+def test_fuzzy_match_is_memoized(mock_config_manager):
+    from pi_inventory_system.item_normalizer import _fuzzy_match
 
-def test_unknown_items(mock_config_manager):
-    # Unknown items should return as-is
-    assert normalize_item_name("unknown item", mock_config_manager) == "unknown item"
-    assert normalize_item_name("random food", mock_config_manager) == "random food"
+    _fuzzy_match.cache_clear()
+    for _ in range(3):
+        assert normalize_item_name("salmun", mock_config_manager) == "salmon"
+    info = _fuzzy_match.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_fuzzy_match_cache_respects_threshold(mock_config_manager):
+    """A stricter threshold must not be answered from a looser cached result."""
+    assert normalize_item_name("salmun", mock_config_manager) == "salmon"
+    mock_config_manager.sections['get_command_config'] = {'similarity_threshold': 0.99}
+    assert normalize_item_name("salmun", mock_config_manager) == "salmun"
@@ -1,3 +1,4 @@
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
@@ -7,6 +8,7 @@ from pi_inventory_system.main import (
     MAX_ORPHANED_VOICE_TASKS,
     FridgePinventoryApp,
 )
+from pi_inventory_system.motion_loop import TRACKING
 
 
 @pytest.fixture
@@ -67,6 +69,79 @@ def test_initialize_reuses_runtime_managers_for_diagnostics(app_context):
     )
 
 
+def test_initialize_warms_up_voice_manager_in_background(app_context):
+    app, _, _, _, _, _, voice, _ = app_context
+
+    with patch('pi_inventory_system.main.run_startup_diagnostics',
+               return_value=(False, True, False, None)):
+        assert app.initialize() is True
+
+    app._voice_future.result(timeout=1.0)
+    voice.initialize.assert_called_once_with()
+    # The warm-up occupies the voice slot, so it is reaped like a listen.
+    assert app._check_voice_future() is False
+    assert app._voice_future is None
+
+
+def test_kick_during_voice_warmup_runs_once_warmup_finishes(app_context):
+    app, _, _, _, _, _, voice, _ = app_context
+    release = threading.Event()
+    voice.initialize.side_effect = lambda: release.wait(timeout=1.0)
+    app._handle_voice_command = MagicMock()
+
+    with patch('pi_inventory_system.main.run_startup_diagnostics',
+               return_value=(False, True, False, None)):
+        assert app.initialize() is True
+    warmup = app._voice_future
+
+    app._kick_voice_command()
+    assert app._voice_future is warmup
+    app._handle_voice_command.assert_not_called()
+
+    release.set()
+    warmup.result(timeout=1.0)
+    assert app._check_voice_future() is True
+    app._voice_future.result(timeout=1.0)
+    app._handle_voice_command.assert_called_once_with(voice)
+
+
+def test_kick_deferred_during_timed_out_warmup_runs_on_fresh_manager(app_context):
+    app, _, _, _, _, _, voice, _ = app_context
+    release = threading.Event()
+    voice.initialize.side_effect = lambda: release.wait(timeout=5.0)
+    app._handle_voice_command = MagicMock()
+
+    try:
+        with patch('pi_inventory_system.main.run_startup_diagnostics',
+                   return_value=(False, True, False, None)):
+            assert app.initialize() is True
+        app._kick_voice_command()
+        app._voice_started_at = time.monotonic() - app._voice_timeout_seconds() - 1
+
+        assert app._check_voice_future() is True
+        replacement = app.voice_manager
+        assert replacement is not voice
+        app._voice_future.result(timeout=1.0)
+        app._handle_voice_command.assert_called_once_with(replacement)
+    finally:
+        release.set()
+
+
+def test_initialize_skips_voice_warmup_in_manual_mode(app_context):
+    app, cfg, _, _, _, _, voice, _ = app_context
+    cfg.get_system_config.return_value = {
+        **cfg.get_system_config.return_value,
+        'activation_mode': 'manual',
+    }
+
+    with patch('pi_inventory_system.main.run_startup_diagnostics',
+               return_value=(False, True, False, None)):
+        assert app.initialize() is True
+
+    assert app._voice_future is None
+    voice.initialize.assert_not_called()
+
+
 def test_handle_voice_command_outputs_confirmation(app_context):
     app, _, _, _, _, _, voice, audio = app_context
     app.running = True
@@ -574,3 +649,58 @@ def test_initialize_does_not_replay_startup_chime(app_context):
 
     audio.play_sound.assert_not_called()
     audio.reset_circuit_breakers.assert_called_once()
+
+
+@pytest.mark.parametrize("woke,rechecks,falls_back", [
+    (True, True, False),
+    (False, False, False),
+    (None, False, True),
+], ids=["edge", "timeout", "no-edge-backend"])
+def test_idle_wait_uses_motion_edge(app_context, woke, rechecks, falls_back):
+    app, _, _, _, _, motion, _, _ = app_context
+    motion.wait_for_motion.return_value = woke
+    loop = MagicMock()
+    app.shutdown_event = MagicMock()
+
+    app._wait_for_motion_edge(loop, 1.0)
+
+    motion.wait_for_motion.assert_called_once_with(1.0)
+    assert loop.request_check.called is rechecks
+    assert app.shutdown_event.wait.called is falls_back
+
+
+def test_idle_wait_rechecks_on_every_edge(app_context):
+    """RPi.GPIO only returns on a new rising edge, so two edges inside one
+    interval must each force a check rather than add an interval of delay."""
+    app, _, _, _, _, motion, _, _ = app_context
+    motion.wait_for_motion.return_value = True
+    loop = MagicMock()
+    app.shutdown_event = MagicMock()
+
+    app._wait_for_motion_edge(loop, 1.0)
+    app._wait_for_motion_edge(loop, 1.0)
+
+    assert loop.request_check.call_count == 2
+    app.shutdown_event.wait.assert_not_called()
+
+
+def test_tracking_sleep_ignores_held_high_sensor(app_context):
+    """In tracking the PIR may stay high through the cooldown; the loop must
+    sleep on the shutdown event rather than spin on the level-based wait."""
+    app, _, _, _, _, motion, _, _ = app_context
+    motion.wait_for_motion.return_value = True
+    loop = app._build_motion_loop()
+    loop.step(0.0, lambda: True)
+    for now in range(1, 6):
+        loop.step(float(now), lambda: False)
+    assert loop.mode == TRACKING
+    last_check = loop.last_check_time
+    app.shutdown_event = MagicMock()
+
+    for _ in range(3):
+        app._sleep_until_next_check(loop, 0.5)
+
+    motion.wait_for_motion.assert_not_called()
+    assert app.shutdown_event.wait.call_count == 3
+    app.shutdown_event.wait.assert_called_with(timeout=0.5)
+    assert loop.last_check_time == last_check
@@ -64,3 +64,12 @@ def test_repeated_motion_does_not_re_signal_new_motion():
     second = loop.step(now=2.0, read_motion=lambda: True)
     assert first.new_motion is True
     assert second.new_motion is False
+
+
+def test_request_check_bypasses_check_interval():
+    loop = make_loop()
+    loop.step(now=1.0, read_motion=lambda: False)
+    loop.request_check()
+    calls = []
+    loop.step(now=1.1, read_motion=lambda: calls.append(1) or False)
+    assert calls == [1]
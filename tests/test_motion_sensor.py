@@ -1,53 +1,115 @@
 # Tests for motion sensor manager
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, Mock
 import sys
+import threading
+import time
+from pi_inventory_system import motion_sensor_manager, platform_info
 from pi_inventory_system.motion_sensor_manager import MotionSensorManager
 
+
 @pytest.fixture
-def mock_config_manager():
-    """Provides a mock config manager for tests."""
-    config = MagicMock()
-    config.get_hardware_config.return_value = {
-        'motion_sensor': {'pin': 4, 'enabled': True}
-    }
-    return config
+def pi_platform(request, monkeypatch):
+    """Stub platform detection and pinctrl for one test.
+
+    Parametrize indirectly with ``(is_pi, is_pi5)``; defaults to a non-Pi5
+    Raspberry Pi. Returns ``(check_pi, check_pi5, subprocess_run)`` mocks.
+    """
+    is_pi, is_pi5 = getattr(request, 'param', (True, False))
+    check_pi = MagicMock(return_value=is_pi)
+    check_pi5 = MagicMock(return_value=is_pi5)
+    run = MagicMock()
+    monkeypatch.setattr(platform_info, 'is_raspberry_pi', check_pi)
+    monkeypatch.setattr(platform_info, 'is_raspberry_pi_5', check_pi5)
+    monkeypatch.setattr(motion_sensor_manager.subprocess, 'run', run)
+    return check_pi, check_pi5, run
+
+
+@pytest.fixture
+def fake_gpio(monkeypatch):
+    """RPi.GPIO stand-in installed in place of the real module import.
+
+    Specced to the calls the manager makes, so a misspelt attribute fails
+    instead of silently growing a child mock.
+    """
+    gpio = Mock(spec=['BCM', 'IN', 'RISING', 'setmode', 'setup', 'input',
+                      'wait_for_edge', 'cleanup'])
+    gpio.BCM = 'BCM'
+    gpio.IN = 'IN'
+    gpio.RISING = 'RISING'
+
+    def init_gpio(self):
+        self._gpio = gpio
 
-@patch('pi_inventory_system.platform_info.is_raspberry_pi_5', return_value=False)
-@patch('pi_inventory_system.platform_info.is_raspberry_pi', return_value=True)
-def test_detect_motion_on_pi(mock_check_pi, mock_check_pi5, mock_config_manager):
+    monkeypatch.setattr(MotionSensorManager, '_init_gpio_module', init_gpio)
+    return gpio
+
+
+@pytest.mark.parametrize("ret,exp", [(1, True), (0, False)])
+def test_detect_motion_on_pi(pi_platform, fake_gpio, mock_config_manager, ret, exp):
     """Test motion detection on a non-Pi5 Raspberry Pi."""
-    # Create mock GPIO module that will be returned by the import
-    mock_gpio = MagicMock()
-    mock_gpio.BCM = 'BCM'
-    mock_gpio.IN = 'IN'
-    
-    # Patch the _init_gpio_module method to set our mock directly
-    def mock_init_gpio(self):
-        self._gpio = mock_gpio
-    
-    with patch.object(MotionSensorManager, '_init_gpio_module', mock_init_gpio):
-        manager = MotionSensorManager(config_manager=mock_config_manager)
-        
-        # Test motion detected
-        mock_gpio.input.return_value = True
-        assert manager.detect_motion() is True
-        mock_gpio.setmode.assert_called_once_with('BCM')
-        mock_gpio.setup.assert_called_once_with(4, 'IN')
-        mock_gpio.input.assert_called_once_with(4)
-
-        # Test no motion
-        mock_gpio.reset_mock()
-        mock_gpio.input.return_value = False
-        assert manager.detect_motion() is False
-        # Initialization should not happen again
-        mock_gpio.setmode.assert_not_called()
-        mock_gpio.setup.assert_not_called()
-        assert mock_gpio.input.call_count == 1
-
-@patch('pi_inventory_system.platform_info.is_raspberry_pi', return_value=False)
-def test_motion_sensor_unsupported_on_non_pi(mock_check_pi, mock_config_manager):
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+    fake_gpio.input.return_value = ret
+
+    assert manager.detect_motion() is exp
+    fake_gpio.input.assert_called_once_with(4)
+
+
+def test_gpio_configured_once(pi_platform, fake_gpio, mock_config_manager):
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+    fake_gpio.input.return_value = False
+
+    manager.detect_motion()
+    manager.detect_motion()
+
+    fake_gpio.setmode.assert_called_once_with('BCM')
+    fake_gpio.setup.assert_called_once_with(4, 'IN')
+    assert fake_gpio.input.call_count == 2
+
+
+def test_gpio_read_error_marks_sensor_unhealthy(pi_platform, fake_gpio, mock_config_manager):
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+    fake_gpio.input.side_effect = RuntimeError("GPIO error")
+
+    assert manager.detect_motion() is False
+    assert manager.is_healthy() is False
+    assert "Failed to read GPIO pin 4" in manager.last_error
+
+    fake_gpio.input.side_effect = None
+    fake_gpio.input.return_value = True
+    assert manager.detect_motion() is True
+    assert manager.is_healthy() is True
+
+
+def test_concurrent_detect_motion_reads_are_serialized(
+    pi_platform,
+    fake_gpio,
+    mock_config_manager,
+):
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+    in_flight = []
+    overlaps = []
+
+    def slow_input(_pin):
+        overlaps.append(bool(in_flight))
+        in_flight.append(1)
+        time.sleep(0.01)
+        in_flight.pop()
+        return True
+
+    fake_gpio.input.side_effect = slow_input
+    threads = [threading.Thread(target=manager.detect_motion) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == [False] * 4
+
+
+@pytest.mark.parametrize('pi_platform', [(False, False)], indirect=True)
+def test_motion_sensor_unsupported_on_non_pi(pi_platform, mock_config_manager):
     """Test that motion sensor is not supported on non-Pi systems."""
     manager = MotionSensorManager(config_manager=mock_config_manager)
     assert manager.is_supported() is False
@@ -55,93 +117,140 @@ def test_motion_sensor_unsupported_on_non_pi(mock_check_pi, mock_config_manager)
     assert manager.detect_motion() is False
 
 
-@patch('pi_inventory_system.platform_info.is_raspberry_pi_5', return_value=False)
-@patch('pi_inventory_system.platform_info.is_raspberry_pi', return_value=True)
 def test_motion_sensor_available_after_initialization(
-    mock_check_pi,
-    mock_check_pi5,
+    pi_platform,
+    fake_gpio,
     mock_config_manager,
 ):
-    mock_gpio = MagicMock()
-    mock_gpio.BCM = 'BCM'
-    mock_gpio.IN = 'IN'
-
-    def mock_init_gpio(self):
-        self._gpio = mock_gpio
-
-    with patch.object(MotionSensorManager, '_init_gpio_module', mock_init_gpio):
-        manager = MotionSensorManager(config_manager=mock_config_manager)
-        assert manager.is_available() is True
-        mock_gpio.setup.assert_called_once_with(4, 'IN')
-
-@patch('pi_inventory_system.platform_info.is_raspberry_pi_5', return_value=True)
-@patch('pi_inventory_system.platform_info.is_raspberry_pi', return_value=True)
-@patch('pi_inventory_system.motion_sensor_manager.subprocess.run')
-def test_detect_motion_on_pi5(mock_subprocess, mock_check_pi, mock_check_pi5, mock_config_manager):
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+    assert manager.is_available() is True
+    fake_gpio.setup.assert_called_once_with(4, 'IN')
+
+
+@pytest.fixture
+def fake_gpiozero(monkeypatch):
+    """Install a gpiozero stand-in; returns the MotionSensor instance it builds."""
+    sensor = MagicMock()
+    module = MagicMock(MotionSensor=MagicMock(return_value=sensor))
+    monkeypatch.setitem(sys.modules, 'gpiozero', module)
+    return sensor
+
+
+@pytest.fixture
+def pi5_manager(pi_platform, mock_config_manager, monkeypatch):
+    """MotionSensorManager on the Pi 5 pinctrl path (gpiozero unavailable)."""
+    monkeypatch.setattr(MotionSensorManager, '_setup_gpiozero_pi5', lambda self: False)
+    return MotionSensorManager(config_manager=mock_config_manager)
+
+
+@pytest.mark.parametrize('pi_platform', [(True, True)], indirect=True)
+@pytest.mark.parametrize('stdout,expected', [
+    ('level=1', True),
+    ('level=0', False),
+    ('4: ip    pd | hi // GPIO4 = input', True),
+    ('4: ip    pd | lo // GPIO4 = input', False),
+], ids=['level-high', 'level-low', 'pinctrl-hi', 'pinctrl-lo'])
+def test_detect_motion_on_pi5_reads_pinctrl_level(pi_platform, pi5_manager, stdout, expected):
     """Test motion detection on Raspberry Pi 5 using pinctrl."""
-    with patch.object(MotionSensorManager, '_setup_gpiozero_pi5', return_value=False):
-        manager = MotionSensorManager(config_manager=mock_config_manager)
-
-        # Mock setup command success
-        mock_subprocess.return_value = MagicMock(stdout='level=1')
-        
-        # Test motion detected
-        assert manager.detect_motion() is True
-        # Check that setup and get were called
-        assert mock_subprocess.call_count == 2
-        assert 'pinctrl' in mock_subprocess.call_args_list[0].args[0]
-        assert 'set' in mock_subprocess.call_args_list[0].args[0]
-        assert 'get' in mock_subprocess.call_args_list[1].args[0]
-
-        # Test no motion
-        mock_subprocess.reset_mock()
-        mock_subprocess.return_value = MagicMock(stdout='level=0')
-        assert manager.detect_motion() is False
-        # Initialization should not happen again, only 'get' should be called
-        assert mock_subprocess.call_count == 1
-        assert 'get' in mock_subprocess.call_args_list[0].args[0]
-
-        # Additional test to ensure correct initialization
-        mock_subprocess.reset_mock()
-        mock_subprocess.return_value = MagicMock(stdout='level=1')
-        assert manager.detect_motion() is True
-        # Check that only 'get' is called after initialization
-        assert mock_subprocess.call_count == 1
-        assert 'get' in mock_subprocess.call_args_list[0].args[0]
-
-        mock_subprocess.reset_mock()
-        mock_subprocess.return_value = MagicMock(stdout='4: ip    pd | hi // GPIO4 = input')
-        assert manager.detect_motion() is True
-        assert mock_subprocess.call_count == 1
-        assert 'get' in mock_subprocess.call_args_list[0].args[0]
-
-        # Additional test to ensure correct initialization
-        mock_subprocess.reset_mock()
-        mock_subprocess.return_value = MagicMock(stdout='level=0')
-        assert manager.detect_motion() is False
-        # Check that only 'get' is called after initialization
-        assert mock_subprocess.call_count == 1
-        assert 'get' in mock_subprocess.call_args_list[0].args[0]
-
-        mock_subprocess.reset_mock()
-        mock_subprocess.return_value = MagicMock(stdout='4: ip    pd | lo // GPIO4 = input')
-        assert manager.detect_motion() is False
-        assert mock_subprocess.call_count == 1
-        assert 'get' in mock_subprocess.call_args_list[0].args[0]
-
-
-@patch('pi_inventory_system.platform_info.is_raspberry_pi_5', return_value=False)
-@patch('pi_inventory_system.platform_info.is_raspberry_pi', return_value=True)
-def test_missing_rpi_gpio_on_real_pi_reports_failure(
-    mock_check_pi,
-    mock_check_pi5,
-    mock_config_manager,
-):
+    _, _, mock_subprocess = pi_platform
+    mock_subprocess.return_value = MagicMock(stdout=stdout)
+
+    assert pi5_manager.detect_motion() is expected
+
+
+@pytest.mark.parametrize('pi_platform', [(True, True)], indirect=True)
+def test_detect_motion_on_pi5_configures_pin_once(pi_platform, pi5_manager):
+    _, _, mock_subprocess = pi_platform
+    mock_subprocess.return_value = MagicMock(stdout='level=1')
+
+    pi5_manager.detect_motion()
+    pi5_manager.detect_motion()
+
+    commands = [c.args[0] for c in mock_subprocess.call_args_list]
+    assert len(commands) == 3
+    assert 'pinctrl' in commands[0] and 'set' in commands[0]
+    # Initialization should not happen again, only 'get' should be called
+    assert all('get' in command for command in commands[1:])
+
+
+@pytest.mark.parametrize('pi_platform', [(True, True)], indirect=True)
+def test_detect_motion_on_pi5_prefers_gpiozero_handle(pi_platform, fake_gpiozero,
+                                                      mock_config_manager):
+    """With gpiozero installed, reads go through the open line handle and
+    never fork pinctrl."""
+    _, _, mock_subprocess = pi_platform
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+    fake_gpiozero.motion_detected = True
+    assert manager.detect_motion() is True
+    fake_gpiozero.motion_detected = False
+    assert manager.detect_motion() is False
+
+    sys.modules['gpiozero'].MotionSensor.assert_called_once_with(4, pull_up=False)
+    mock_subprocess.assert_not_called()
+
+
+@pytest.mark.parametrize('channel,expected', [(4, True), (None, False)],
+                         ids=['edge', 'timeout'])
+def test_wait_for_motion_blocks_on_gpio_edge(pi_platform, fake_gpio, mock_config_manager,
+                                             channel, expected):
+    fake_gpio.wait_for_edge.return_value = channel
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+
+    assert manager.wait_for_motion(1.0) is expected
+    fake_gpio.wait_for_edge.assert_called_once_with(4, 'RISING', timeout=1000)
+    fake_gpio.input.assert_not_called()
+
+
+def test_wait_for_motion_failure_falls_back_to_polling(pi_platform, fake_gpio,
+                                                      mock_config_manager):
+    """A failing edge wait disables interrupts but leaves the sensor healthy,
+    since GPIO.input may still work."""
+    fake_gpio.wait_for_edge.side_effect = RuntimeError("Failed to add edge detection")
+    fake_gpio.input.return_value = 1
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+
+    assert manager.wait_for_motion(1.0) is None
+    assert manager.wait_for_motion(1.0) is None
+    fake_gpio.wait_for_edge.assert_called_once()
+    assert manager.is_healthy() is True
+    assert manager.last_error is None
+    assert manager.detect_motion() is True
+
+
+def test_wait_for_motion_disabled_by_config(pi_platform, fake_gpio, mock_config_manager):
+    mock_config_manager.sections['get_hardware_config'] = {
+        'motion_sensor': {'pin': 4, 'use_interrupt': False},
+    }
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+
+    assert manager.wait_for_motion(1.0) is None
+    fake_gpio.wait_for_edge.assert_not_called()
+
+
+@pytest.mark.parametrize('pi_platform', [(True, True)], indirect=True)
+def test_wait_for_motion_uses_gpiozero_event_on_pi5(pi_platform, fake_gpiozero,
+                                                    mock_config_manager):
+    fake_gpiozero.wait_for_motion.return_value = True
+    manager = MotionSensorManager(config_manager=mock_config_manager)
+
+    assert manager.wait_for_motion(0.5) is True
+    fake_gpiozero.wait_for_motion.assert_called_once_with(0.5)
+
+
+@pytest.mark.parametrize('pi_platform', [(True, True)], indirect=True)
+def test_wait_for_motion_without_edge_backend_returns_none(pi_platform, pi5_manager):
+    """The pinctrl fallback cannot wait on edges; callers keep polling."""
+    assert pi5_manager.wait_for_motion(1.0) is None
+
+
+def test_missing_rpi_gpio_on_real_pi_reports_failure(pi_platform, mock_config_manager,
+                                                     monkeypatch):
     """On a real Pi, missing RPi.GPIO must surface as a hardware failure.
     The old MockGPIO fallback made diagnostics report the sensor healthy
     while input() could never see motion."""
-    with patch.dict(sys.modules, {'RPi': None, 'RPi.GPIO': None}):
-        manager = MotionSensorManager(config_manager=mock_config_manager)
+    monkeypatch.setitem(sys.modules, 'RPi', None)
+    monkeypatch.setitem(sys.modules, 'RPi.GPIO', None)
+    manager = MotionSensorManager(config_manager=mock_config_manager)
 
     assert manager.is_supported() is True   # platform supports it...
     assert manager.is_healthy() is False    # ...but hardware access failed
@@ -150,12 +259,8 @@ def test_missing_rpi_gpio_on_real_pi_reports_failure(
     assert "RPi.GPIO" in (manager.last_error or "")
 
 
-@patch('pi_inventory_system.platform_info.is_raspberry_pi_5', return_value=True)
-@patch('pi_inventory_system.platform_info.is_raspberry_pi', return_value=True)
-def test_motion_pin_defaults_to_gpio4_when_config_pin_is_none(
-    mock_check_pi,
-    mock_check_pi5,
-):
+@pytest.mark.parametrize('pi_platform', [(True, True)], indirect=True)
+def test_motion_pin_defaults_to_gpio4_when_config_pin_is_none(pi_platform):
     config = MagicMock()
     config.get_hardware_config.return_value = {
         'motion_sensor': {'pin': None, 'enabled': True}
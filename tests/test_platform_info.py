@@ -0,0 +1,51 @@
+# Tests for platform detection helpers
+
+import os
+
+import pytest
+
+from pi_inventory_system import platform_info
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "model"
+    path.write_text("Raspberry Pi 5 Model B Rev 1.0\x00")
+    platform_info._read_model.cache_clear()
+    yield str(path)
+    platform_info._read_model.cache_clear()
+
+
+def test_detects_pi5_from_model_file(model_file):
+    assert platform_info.is_raspberry_pi(model_file=model_file) is True
+    assert platform_info.is_raspberry_pi_5(model_file=model_file) is True
+
+
+def test_missing_model_file_is_not_a_pi(tmp_path):
+    assert platform_info.is_raspberry_pi(model_file=str(tmp_path / "absent")) is False
+
+
+def test_model_file_is_read_once(model_file):
+    platform_info.is_raspberry_pi(model_file=model_file)
+    os.remove(model_file)
+
+    # Served from the cache: a fresh read would now report "not a Pi".
+    assert platform_info.is_raspberry_pi_5(model_file=model_file) is True
+    assert platform_info._read_model.cache_info().hits == 1
+
+
+def test_transient_read_error_is_not_cached(model_file, monkeypatch):
+    real_open = open
+    calls = []
+
+    def flaky_open(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise PermissionError("busy")
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(platform_info, "open", flaky_open, raising=False)
+
+    assert platform_info.is_raspberry_pi(model_file=model_file) is False
+    assert platform_info.is_raspberry_pi(model_file=model_file) is True
+    assert len(calls) == 2
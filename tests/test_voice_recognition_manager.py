@@ -2,6 +2,8 @@ import sys
 from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from pi_inventory_system.voice_recognition_manager import VoiceRecognitionManager, sr
 
 
@@ -155,6 +157,38 @@ def test_microphone_uses_resolved_index():
     microphone_cls.assert_called_once_with(device_index=2)
 
 
+def test_microphone_opens_at_configured_sample_rate():
+    cfg = MagicMock()
+    cfg.get_audio_config.return_value = {'voice_recognition': {'sample_rate': 16000}}
+
+    with patch('pi_inventory_system.voice_recognition_manager.sr.Microphone',
+               return_value=_microphone()) as microphone_cls:
+        manager = VoiceRecognitionManager(config_manager=cfg)
+        manager._recognizer = MagicMock()
+        manager._pyaudio_instance = _fake_pyaudio([])
+
+        assert manager._initialize_microphone() is True
+
+    microphone_cls.assert_called_once_with(sample_rate=16000)
+
+
+@pytest.mark.parametrize("sample_rate", [True, 0, -16000, "16000", 16000.0])
+def test_invalid_sample_rate_is_ignored_with_warning(sample_rate, caplog):
+    cfg = MagicMock()
+    cfg.get_audio_config.return_value = {'voice_recognition': {'sample_rate': sample_rate}}
+
+    with patch('pi_inventory_system.voice_recognition_manager.sr.Microphone',
+               return_value=_microphone()) as microphone_cls:
+        manager = VoiceRecognitionManager(config_manager=cfg)
+        manager._recognizer = MagicMock()
+        manager._pyaudio_instance = _fake_pyaudio([])
+
+        assert manager._initialize_microphone() is True
+
+    microphone_cls.assert_called_once_with()
+    assert "Invalid sample_rate" in caplog.text
+
+
 def test_initialization_retries_after_cooldown():
     cfg = _config(cooldown=0)
     recognizer = MagicMock()
@@ -176,6 +210,28 @@ def test_initialization_retries_after_cooldown():
         assert manager._retry_count == 0
 
 
+def test_recognizer_and_microphone_reused_across_commands():
+    """Back-to-back commands share one Recognizer, one Microphone and a single
+    ambient-noise calibration."""
+    recognizer = MagicMock()
+    mic = _microphone()
+
+    with patch('pi_inventory_system.voice_recognition_manager.sr.Recognizer',
+               return_value=recognizer) as recognizer_cls, \
+         patch('pi_inventory_system.voice_recognition_manager.sr.Microphone',
+               return_value=mic) as microphone_cls:
+        manager = VoiceRecognitionManager(config_manager=_config(cooldown=0))
+        manager._recognize_with_fallback = MagicMock(return_value="add one salmon")
+
+        assert manager.recognize_speech() == "add one salmon"
+        assert manager.recognize_speech() == "add one salmon"
+
+    recognizer_cls.assert_called_once_with()
+    assert microphone_cls.call_count == 1
+    recognizer.adjust_for_ambient_noise.assert_called_once()
+    assert recognizer.listen.call_count == 2
+
+
 def test_initialization_failure_respects_retry_cooldown():
     cfg = _config(cooldown=60)
 
@@ -220,6 +276,19 @@ def test_recognition_returns_none_when_all_engines_fail():
     assert result is None
 
 
+def test_default_config_never_reaches_network_recognizer():
+    """Offline Sphinx is the only engine unless Google is opted into."""
+    manager = VoiceRecognitionManager(config_manager=_config(cooldown=0))
+    manager._recognizer = MagicMock()
+    manager._recognizer.recognize_sphinx.side_effect = sr.UnknownValueError()
+
+    with patch('pi_inventory_system.voice_recognition_manager.get_grammar_path',
+               return_value=None):
+        assert manager._recognize_with_fallback(object(), {}) is None
+
+    manager._recognizer.recognize_google.assert_not_called()
+
+
 def test_sphinx_uses_pocketsphinx5_grammar_decoder(monkeypatch):
     # speech_recognition's grammar= plumbing targets the pre-5.0 pocketsphinx
     # API and raises TypeError on modern installs; the manager must drive the